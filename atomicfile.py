@@ -0,0 +1,73 @@
+"""
+atomicfile.py — replace files atomically, with ordinary permissions.
+
+Every file the tools write themselves (indicator YAML, the catalog, built
+pages, chart data, assets and their compressed siblings, manifests, caches)
+goes through `replacing(path)`, except Jinja's bytecode cache and precompiled
+template modules, which Jinja writes itself. The content is written to a
+temporary file in the same directory, which is renamed over `path` only once
+the block completes, so readers — a web server, a concurrent build or update
+run — never see a half-written file, and on an error `path` is left as it was.
+
+`tempfile.mkstemp` creates its file as 0600; before the rename the temporary
+file is given the mode `path` already has or, for a new file, the mode
+`open()` would have created it with (0666 less the umask).
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+
+def _umask() -> int:
+    # The umask can only be read by setting it; do that once, at import, rather
+    # than while other threads may be creating files.
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_NEW_FILE_MODE = 0o666 & ~_umask()
+
+
+@contextmanager
+def replacing(path: str | os.PathLike, binary: bool = False) -> Iterator[IO]:
+    """
+    A file (text, or bytes if `binary`) that atomically replaces `path` once
+    the block completes. The parent directory is created if needed.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with (os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", encoding="utf-8")) as f:
+            yield f
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_bytes(path: str | os.PathLike, body: bytes) -> None:
+    """Atomically replace `path` with `body`."""
+    with replacing(path, binary=True) as f:
+        f.write(body)
+
+
+def write_text(path: str | os.PathLike, text: str) -> None:
+    """Atomically replace `path` with `text` (UTF-8)."""
+    with replacing(path) as f:
+        f.write(text)
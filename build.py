@@ -4,75 +4,135 @@ build.py — static site generator for the data indicator schema.
 Usage:
     python build.py           # builds to ./dist
     python build.py ./out     # builds to ./out
+    python build.py --full    # re-render every page, ignoring the build manifest
+    python build.py --jobs 8  # render pages in 8 worker processes
+    python build.py --chart-points 300 --zoom-levels 3   # coarser charts, zoomable detail
+
+    python build.py --precompile build/templates   # compile templates to Python modules
+    python build.py --compiled build/templates     # render with the compiled modules
 """
 
 from __future__ import annotations
 
+import argparse
+import gzip
+import hashlib
 import json
 import os
-import sys
+import urllib.error
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
 import jinja2
+import jinja2.meta
+
+import atomicfile
+from collectors.client import fetch
+from downsample import lttb, pyramid
+from metrics import period_codes, summarise, tail_summary
+from minify import minify
+from series import Series
+from terms import term_stats
+from update import Indicator, load_all
 
-from update import Indicator
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
-OUTPUT_DIR = sys.argv[1] if len(sys.argv) > 1 else "./dist"
+OUTPUT_DIR = "./dist"
 TEMPLATE_DIR = "templates"
 CHART_YEARS = 25
+CHART_POINTS = 500   # LTTB target per chart; 0 sends every point
+ZOOM_LEVELS = 1      # resolutions per chart; more adds finer levels shown on zoom
+CHUNK_YEARS = 5      # chart data files each cover this many calendar years
+TABLE_PAGE_SIZE = 500   # data table rows per page (rendered a screenful at a time)
 
+# Chart data and overlays are written here (relative to the output directory)
+# under content-hashed names, so unchanged files stay cached across deploys.
+ASSETS_DIR = "json"
+DEFAULT_JOBS = 1
 
-# ── helpers ───────────────────────────────────────────────────────────────────
+# Third-party files the pages load, pinned by version. The build downloads each
+# once into VENDOR_CACHE_DIR and copies it to STATIC_DIR under a content-hashed
+# name, together with the site stylesheet from STATIC_SOURCE_DIR.
+STATIC_DIR        = "assets"
+STATIC_SOURCE_DIR = Path("static")
+VENDOR_CACHE_DIR  = Path(".cache") / "vendor"
+VENDOR = {
+    "bootstrap.css":                "https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css",
+    "bootstrap.js":                 "https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js",
+    "chart.js":                     "https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js",
+    "chartjs-adapter-date-fns.js":  "https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3.0.0/dist/chartjs-adapter-date-fns.bundle.min.js",
+    "chartjs-plugin-annotation.js": "https://cdn.jsdelivr.net/npm/chartjs-plugin-annotation@3.0.1/dist/chartjs-plugin-annotation.min.js",
+    "chartjs-plugin-zoom.js":       "https://cdn.jsdelivr.net/npm/chartjs-plugin-zoom@2.0.1/dist/chartjs-plugin-zoom.min.js",
+    "hammer.js":                    "https://cdn.jsdelivr.net/npm/hammerjs@2.0.8/hammer.min.js",
+}
 
-def _cutoff() -> str:
-    today = date.today()
-    return f"{today.year - CHART_YEARS}-{today.month:02d}-{today.day:02d}"
+# Cloudflare Pages response headers: hashed files never change under their name.
+HEADERS_FILE = "_headers"
+HEADERS = f"""/{STATIC_DIR}/*
+  Cache-Control: public, max-age=31536000, immutable
+/{ASSETS_DIR}/*
+  Cache-Control: public, max-age=31536000, immutable
+"""
 
+# --compress writes .gz (and, with the brotli package, .br) siblings of these.
+COMPRESS_SUFFIXES = (".html", ".json", ".svg", ".css", ".js")
+COMPRESS_MIN_BYTES = 1024   # smaller files gain too little to be worth a sibling
+
+# Per output directory: output path -> hash of everything the page was built from
+# ({key}.json), and every file of the built site -> content hash together with
+# what changed since the last build ({key}.deploy.json, unless --deploy-manifest
+# says otherwise). Both are kept outside the output directory so they are not
+# deployed themselves.
+MANIFEST_DIR = Path(".cache") / "build"
+
+# Compiled template bytecode, reused until a template's source changes.
+TEMPLATE_CACHE_DIR = Path(".cache") / "jinja2"
+
+# Written next to precompiled template modules: hash of the sources they came from.
+COMPILED_STAMP = "templates.sha256"
+
+# Python sources whose code shapes the rendered pages.
+RENDER_SOURCES = ("build.py", "catalog.py", "datacache.py", "downsample.py", "metrics.py",
+                  "minify.py", "series.py", "terms.py", "update.py")
 
-def _sparkline(values: list[float], width: int = 140, height: int = 36) -> str:
-    if len(values) < 2:
-        return ""
-    mn, mx = min(values), max(values)
-    pad = 2
-    if mx == mn:
-        mid = height / 2
-        pts = f"0,{mid:.0f} {width},{mid:.0f}"
-    else:
-        n = len(values) - 1
-        pts = " ".join(
-            f"{i / n * width:.1f},{pad + (1 - (v - mn) / (mx - mn)) * (height - 2 * pad):.1f}"
-            for i, v in enumerate(values)
-        )
-    return (
-        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
-        f'<polyline points="{pts}" fill="none" stroke="#3498db" stroke-width="1.5" '
-        f'stroke-linejoin="round" stroke-linecap="round"/></svg>'
-    )
 
+# ── helpers ───────────────────────────────────────────────────────────────────
 
-def _rag(values: list[float], direction: str) -> str:
-    """'good', 'bad', or '' comparing latest value to ~12 data points ago."""
-    if not direction or len(values) < 2:
-        return ""
-    lookback = min(12, len(values) - 1)
-    delta = values[-1] - values[-lookback - 1]
-    if abs(delta) < 1e-9:
-        return ""
-    if direction == "lower_is_better":
-        return "good" if delta < 0 else "bad"
-    if direction == "higher_is_better":
-        return "good" if delta > 0 else "bad"
-    return ""
+def _cutoff() -> str:
+    today = date.today()
+    day = 28 if (today.month, today.day) == (2, 29) else today.day
+    return date(today.year - CHART_YEARS, today.month, day).isoformat()
 
 
-def _chart_series(graph: dict, cutoff: str) -> list[dict]:
-    """[{x, y}] for Chart.js, limited to dates >= cutoff."""
+def _chart_series(graph: dict, cutoff: str, target: int = CHART_POINTS, levels: int = 1) -> list[list[dict]]:
+    """
+    [{x, y}] for Chart.js, limited to dates >= cutoff, at one or more
+    resolutions, coarsest first. Series longer than `target` points are
+    downsampled with LTTB; with levels > 1, finer levels follow, the last
+    holding every point. Every level keeps the first missing point of each
+    run of missing points, so a gap breaks the line at every resolution.
+    """
+    data: Series = graph.get("data", Series()).slice(cutoff)
+    points = [{"x": d, "y": v} for d, v in data.items()]
+    if not target or len(points) <= target:
+        return [points]
+
+    # Downsample the present points, then put back the start of each gap.
+    floats = data.floats
+    present = [i for i, v in enumerate(floats) if v == v]
+    gaps = [i for i, v in enumerate(floats) if v != v and (i == 0 or floats[i - 1] == floats[i - 1])]
+    xs = [data.ordinals[i] for i in present]
+    ys = [floats[i] for i in present]
+    picks = pyramid(xs, ys, target, levels) if levels > 1 else [lttb(xs, ys, target)]
     return [
-        {"x": d, "y": v}
-        for d, v in sorted(graph.get("data", {}).items())
-        if d >= cutoff
+        points if len(idx) == len(present)
+        else [points[i] for i in sorted({present[j] for j in idx}.union(gaps))]
+        for idx in picks
     ]
 
 
@@ -100,218 +160,880 @@ def _overlay_windowed(overlay_ind: Indicator, cutoff: str) -> list[dict]:
 
 def _gov_performance(graph: dict, overlay: list[dict]) -> list[dict] | None:
     """
-    For each government in overlay, calculate the delta (end - start) of the
-    graph's metric during their term. Returns a list suitable for a bar chart,
-    or None if direction is not set.
+    For each government in overlay, the delta (end - start) of the graph's
+    metric during their term, plus the term's mean, min, max and annualised
+    change (see terms.py). Returns a list suitable for a bar chart, or None if
+    direction is not set.
     """
     direction = graph.get("direction")
     if not direction or not overlay:
         return None
 
-    data = sorted(
-        [(d, v) for d, v in graph.get("data", {}).items() if isinstance(v, (int, float))]
-    )
-    if not data:
+    data: Series = graph.get("data", Series())
+    if not len(data):
         return None
 
     result = []
-    for i, gov in enumerate(overlay):
-        next_gov = overlay[i + 1] if i + 1 < len(overlay) else None
-
-        start_val = next((v for d, v in data if d >= gov["date"]), None)
-        if next_gov:
-            end_val = next((v for d, v in reversed(data) if d < next_gov["date"]), None)
-        else:
-            end_val = data[-1][1]
-
-        if start_val is None or end_val is None:
+    for term in term_stats(data, overlay, direction):
+        if term["delta"] is None:
             continue
-
-        delta = end_val - start_val
-        if abs(delta) < 1e-9:
-            rag = "neutral"
-        elif direction == "lower_is_better":
-            rag = "good" if delta < 0 else "bad"
-        else:
-            rag = "good" if delta > 0 else "bad"
+        gov = term["gov"]
 
         # Surname only for compact bar labels
         surname = gov["value"].split()[-1]
         result.append({
-            "label":     surname,
-            "full_name": gov["value"],
-            "party":     gov["party"],
-            "colour":    gov["colour"],
-            "delta":     round(delta, 4),
-            "rag":       rag,
+            "label":      surname,
+            "full_name":  gov["value"],
+            "party":      gov["party"],
+            "colour":     gov["colour"],
+            "delta":      round(term["delta"], 4),
+            "rag":        term["rag"],
+            "mean":       term["mean"],
+            "min":        term["min"],
+            "max":        term["max"],
+            "annualised": term["annualised"],
         })
 
     return result or None
 
 
-def _table_data(ind: Indicator) -> tuple[list[str], list[list]]:
+def _scorecard(overlay: list[dict], inds: list[Indicator], overlay_id: str) -> dict:
     """
-    (headers, rows) for the data table, most recent first.
-    Each value cell is a dict {value, rag} where rag is 'good'/'bad'/'' based
-    on the change from the previous period and the graph's direction.
+    Governments × indicators matrix for one jurisdiction, computed in one pass
+    per indicator (term_stats covers every term at once). Each indicator is
+    scored on its first directed graph that overlays `overlay_id`.
+
+    Returns {"indicators": [...], "governments": [...]} with governments most
+    recent first, leaving out terms no indicator has data for. Each government
+    carries one cell per indicator (None when the indicator has no data for
+    that term) and its good/neutral/bad/missing counts.
+    """
+    columns = []
+    for ind in sorted(inds, key=lambda i: (i.category, i.title)):
+        graph = next((
+            g for g in ind.chart_graphs
+            if g.get("direction") and g.get("overlay_metric") == overlay_id
+        ), None)
+        if graph is None:
+            continue
+        columns.append((ind, graph, term_stats(graph.get("data", Series()), overlay, graph["direction"])))
+
+    governments = []
+    for i, gov in enumerate(overlay):
+        cells = []
+        for ind, graph, terms in columns:
+            term = terms[i]
+            if term["delta"] is None:
+                cells.append(None)
+                continue
+            start = term["start"]
+            cells.append({
+                "start":      start,
+                "end":        term["end"],
+                "delta":      round(term["delta"], 4),
+                "change_pct": round(term["delta"] / start * 100, 1) if start else None,
+                "rag":        term["rag"],
+                "mean":       term["mean"],
+                "annualised": term["annualised"],
+                "points":     term["points"],
+            })
+        if not any(cells):
+            continue   # before any indicator has data
+        rags = [c["rag"] if c else "missing" for c in cells]
+        governments.append({
+            "index":    i,
+            "name":     gov["value"],
+            "party":    gov["party"],
+            "colour":   gov["colour"],
+            "date":     str(gov["date"]),
+            "end_date": str(overlay[i + 1]["date"]) if i + 1 < len(overlay) else None,
+            "cells":    cells,
+            "good":     rags.count("good"),
+            "neutral":  rags.count("neutral"),
+            "bad":      rags.count("bad"),
+            "missing":  rags.count("missing"),
+            "score":    rags.count("good") - rags.count("bad"),
+        })
+
+    return {
+        "indicators": [
+            {"id": ind.id, "title": ind.title, "category": ind.category,
+             "y_label": graph.get("y", ""), "direction": graph["direction"]}
+            for ind, graph, _ in columns
+        ],
+        "governments": governments[::-1],
+    }
+
+
+def _table_data(ind: Indicator) -> tuple[list[str], dict | None]:
+    """
+    (headers, payload) for the data table. The payload is columnar, most
+    recent first, and rendered client-side a screenful of rows at a time:
+
+        {"dates": [...], "columns": [[value, ...], ...], "rag": ["gb-...", ...]}
+
+    with one RAG code per cell (see metrics.period_codes). Values are sent as
+    the strings Python prints for them (null when missing), so the table shows
+    `4.0` for a float and `685000` for an int; JSON numbers would lose that.
     """
     cg = ind.chart_graphs
     if not cg:
-        return [], []
+        return [], None
 
+    series = [g.get("data", Series()) for g in cg]
     directions = [g.get("direction", "") for g in cg]
-    all_dates = sorted(
-        set().union(*(set(g.get("data", {}).keys()) for g in cg))
-    )  # ascending for delta calc
-
-    # Build rows ascending first so we can compute deltas
-    asc_rows = []
-    for d in all_dates:
-        cells = []
-        for g in cg:
-            v = g.get("data", {}).get(d)
-            cells.append(v)
-        asc_rows.append((d, cells))
+    if len(series) == 1:
+        all_dates = list(series[0])  # already ascending for delta calc
+        columns = [[v for _, v in series[0].items()]]
+        codes = [summarise(series[0], directions[0])["codes"]]
+    else:
+        all_dates = sorted(set().union(*(set(s) for s in series)))
+        columns = [[s.get(d) for d in all_dates] for s in series]
+        codes = [period_codes(col, d) for col, d in zip(columns, directions)]
 
-    # Now reverse for display and attach RAG based on delta vs previous row
     headers = ["Date"] + [g.get("y", f"Series {i + 1}") for i, g in enumerate(cg)]
-    rows = []
-    for row_i, (d, cells) in enumerate(reversed(asc_rows)):
-        orig_i = len(asc_rows) - 1 - row_i
-        display_cells = [d]
-        for col_i, v in enumerate(cells):
-            rag = ""
-            if v is not None and orig_i > 0:
-                prev_v = asc_rows[orig_i - 1][1][col_i]
-                if prev_v is not None and isinstance(v, (int, float)) and isinstance(prev_v, (int, float)):
-                    delta = v - prev_v
-                    direction = directions[col_i]
-                    if abs(delta) > 1e-9 and direction:
-                        if direction == "lower_is_better":
-                            rag = "good" if delta < 0 else "bad"
-                        elif direction == "higher_is_better":
-                            rag = "good" if delta > 0 else "bad"
-            display_cells.append({"value": v if v is not None else "", "rag": rag})
-        rows.append(display_cells)
-
-    return headers, rows
+    payload = {
+        "dates":   all_dates[::-1],
+        "columns": [[None if v is None else str(v) for v in col[::-1]] for col in columns],
+        "rag":     [c[::-1] for c in codes],
+    }
+    return headers, payload
 
 
 # ── Jinja2 ────────────────────────────────────────────────────────────────────
 
-def _env() -> jinja2.Environment:
+def _env(compiled: str | None = None) -> jinja2.Environment:
+    """
+    Environment over TEMPLATE_DIR, with compiled bytecode cached on disk (Jinja2
+    checks each template's source checksum, so an edited template is
+    recompiled). With `compiled`, templates are imported from modules written
+    by --precompile instead and nothing is compiled at all.
+    """
+    if compiled is not None:
+        loader: jinja2.BaseLoader = jinja2.ModuleLoader(compiled)
+        bytecode_cache = None
+    else:
+        TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        loader = jinja2.FileSystemLoader(TEMPLATE_DIR)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR))
     env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(TEMPLATE_DIR),
+        loader=loader,
         autoescape=jinja2.select_autoescape(["html"]),
+        bytecode_cache=bytecode_cache,
     )
     env.filters["tojson"] = lambda v: json.dumps(v, default=str)
     return env
 
 
-def _render(env: jinja2.Environment, template: str, path: str, **ctx) -> None:
-    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-    out = env.get_template(template).render(**ctx)
-    Path(path).write_text(out, encoding="utf-8")
-    print(f"  {path}")
-
+def _sources_hash(env: jinja2.Environment) -> str:
+    return _hash([(t, env.loader.get_source(env, t)[0]) for t in env.list_templates()])
 
-# ── main ──────────────────────────────────────────────────────────────────────
 
-def main() -> None:
+def _precompile(target: str) -> None:
+    """Compile every template in TEMPLATE_DIR into importable modules under `target`."""
     env = _env()
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    cutoff = _cutoff()
+    os.makedirs(target, exist_ok=True)
+    env.compile_templates(target, zip=None, ignore_errors=False)
+    atomicfile.write_text(Path(target, COMPILED_STAMP), _sources_hash(env) + "\n")
+    print(f"  {target}: {len(env.list_templates())} template(s) compiled")
+
 
-    all_indicators: list[Indicator] = [
-        Indicator(p) for p in sorted(Path("data").glob("*.yaml"))
+def _check_compiled(compiled: str) -> None:
+    try:
+        stamp = Path(compiled, COMPILED_STAMP).read_text(encoding="utf-8").strip()
+    except OSError:
+        raise SystemExit(f"{compiled} does not contain precompiled templates; run --precompile first")
+    if stamp != _sources_hash(_env()):
+        raise SystemExit(f"templates changed since {compiled} was compiled; run --precompile again")
+
+
+def _render(
+    env: jinja2.Environment, template: str, path: str, *, minified: bool = False, **ctx
+) -> tuple[bool, int, int]:
+    """
+    Render `template` to `path`, streamed through the minifier if `minified`.
+    A file whose content would not change is not rewritten (its mtime stays
+    put for the deploy). Returns whether it was, and the page's size in bytes
+    before and after minifying.
+    """
+    tmpl = env.get_template(template)
+    if minified:
+        out, size = minify(tmpl.generate(**ctx))
+    else:
+        out = tmpl.render(**ctx)
+        size = len(out.encode("utf-8"))
+    sizes = (size, len(out.encode("utf-8")))
+    try:
+        if Path(path).read_text(encoding="utf-8") == out:
+            return False, *sizes
+    except (OSError, UnicodeDecodeError):
+        pass
+    atomicfile.write_text(path, out)
+    return True, *sizes
+
+
+# ── chart data files ──────────────────────────────────────────────────────────
+
+def _write_hashed(out_dir: str, directory: str, name: str, suffix: str, body: bytes) -> str:
+    """
+    Write `body` to {directory}/{name}.{content hash}{suffix} (once — the name
+    changes whenever the content does) and return its site-relative URL.
+    """
+    url = f"{directory}/{name}.{hashlib.sha256(body).hexdigest()[:12]}{suffix}"
+    path = Path(out_dir, url)
+    if not path.exists():
+        atomicfile.write_bytes(path, body)
+    return url
+
+
+def _write_asset(out_dir: str, name: str, obj: object) -> str:
+    """Write `obj` as JSON to ASSETS_DIR/{name}.{content hash}.json; returns its URL."""
+    body = json.dumps(obj, default=str, separators=(",", ":")).encode()
+    return _write_hashed(out_dir, ASSETS_DIR, name, ".json", body)
+
+
+def _write_chunks(out_dir: str, name: str, points: list[dict]) -> list[dict]:
+    """
+    Split [{x, y}] into CHUNK_YEARS-year files; returns [{from, to, n, url}]
+    (from inclusive, to exclusive) in date order.
+    """
+    chunks: dict[int, list[dict]] = defaultdict(list)
+    for p in points:
+        chunks[int(p["x"][:4]) // CHUNK_YEARS * CHUNK_YEARS].append(p)
+    return [
+        {
+            "from": f"{year:04d}-01-01",
+            "to":   f"{year + CHUNK_YEARS:04d}-01-01",
+            "n":    len(chunk),
+            "url":  _write_asset(out_dir, f"{name}-{year}", chunk),
+        }
+        for year, chunk in sorted(chunks.items())
     ]
-    by_id: dict[str, Indicator] = {ind.id: ind for ind in all_indicators}
 
-    chart_indicators = [ind for ind in all_indicators if not ind.is_overlay]
 
-    by_jurisdiction: dict[str, list[Indicator]] = defaultdict(list)
-    for ind in chart_indicators:
-        by_jurisdiction[ind.jurisdiction].append(ind)
+# ── static assets ─────────────────────────────────────────────────────────────
 
-    # ── Home page ─────────────────────────────────────────────────────────────
-    _render(env, "index.jinja", f"{OUTPUT_DIR}/index.html",
-            jurisdictions=sorted(by_jurisdiction.keys()),
-            page_id="index")
+def _vendored(name: str, url: str) -> bytes | None:
+    """A VENDOR file from VENDOR_CACHE_DIR, downloaded on first use; None if that fails."""
+    path = VENDOR_CACHE_DIR / name
+    if path.exists():
+        return path.read_bytes()
+    try:
+        body = fetch(url, timeout=30)
+    except (urllib.error.URLError, OSError) as exc:
+        print(f"  warning: could not download {url} ({exc}); pages will load it from the CDN")
+        return None
+    atomicfile.write_bytes(path, body)
+    return body
 
-    # ── Per-jurisdiction pages ────────────────────────────────────────────────
-    for jurisdiction, inds in sorted(by_jurisdiction.items()):
-        slug = jurisdiction.lower().replace(" ", "_")
 
-        by_cat: dict[str, list[dict]] = defaultdict(list)
-        for ind in sorted(inds, key=lambda i: i.title):
-            cg = ind.chart_graphs
-            if not cg:
-                continue
-            direction = cg[0].get("direction", "")
-            sorted_data = sorted(cg[0].get("data", {}).items())
-            values = [v for _, v in sorted_data if isinstance(v, (int, float))]
-            latest_date = sorted_data[-1][0] if sorted_data else None
-            latest_val  = sorted_data[-1][1] if sorted_data else None
-
-            by_cat[ind.category].append({
-                "id":           ind.id,
-                "title":        ind.title,
-                "url":          f"{slug}_{ind.id}.html",
-                "sparkline":    _sparkline(values),
-                "rag":          _rag(values, direction),
-                "latest_value": latest_val,
-                "latest_date":  latest_date,
-                "y_label":      cg[0].get("y", ""),
-            })
+def _static_assets(out_dir: str) -> dict[str, str]:
+    """
+    Copy the vendored libraries and the site stylesheets into STATIC_DIR under
+    content-hashed names, delete files there that are no longer current, and
+    write the HEADERS_FILE. Returns name -> URL for the templates' `static`;
+    a library that could not be downloaded keeps its CDN URL.
+    """
+    urls = {}
+    for name, cdn in VENDOR.items():
+        body = _vendored(name, cdn)
+        stem, suffix = os.path.splitext(name)
+        urls[name] = cdn if body is None else _write_hashed(out_dir, STATIC_DIR, stem, suffix, body)
+    for path in sorted(STATIC_SOURCE_DIR.glob("*.css")):
+        urls[path.name] = _write_hashed(out_dir, STATIC_DIR, path.stem, path.suffix, path.read_bytes())
+
+    current = set(urls.values())
+    for path in Path(out_dir, STATIC_DIR).iterdir():
+        if path.suffix not in _COMPRESSORS and f"{STATIC_DIR}/{path.name}" not in current:
+            path.unlink()
+
+    headers = Path(out_dir, HEADERS_FILE)
+    if not headers.exists() or headers.read_text(encoding="utf-8") != HEADERS:
+        atomicfile.write_text(headers, HEADERS)
+    return urls
+
 
-        _render(env, "jurisdiction.jinja", f"{OUTPUT_DIR}/{slug}.html",
-                jurisdiction=jurisdiction,
+# ── pages ─────────────────────────────────────────────────────────────────────
+
+class _Site:
+    """
+    The loaded indicators, indexed the ways the page builders need them. Their
+    catalog entries (`catalog[id]`) answer everything short of the data itself.
+    """
+
+    def __init__(
+        self,
+        indicators: list[Indicator],
+        cutoff: str,
+        chart_points: int = CHART_POINTS,
+        zoom_levels: int = ZOOM_LEVELS,
+        out_dir: str = OUTPUT_DIR,
+        minified: bool = False,
+        static: dict[str, str] | None = None,
+    ) -> None:
+        self.cutoff = cutoff
+        self.out_dir = out_dir
+        self.chart_points = chart_points
+        self.zoom_levels = zoom_levels
+        self.minified = minified
+        self.static = static or {}
+        self.by_id: dict[str, Indicator] = {ind.id: ind for ind in indicators}
+        self.catalog: dict[str, dict] = {ind.id: ind.catalog_entry for ind in indicators}
+        self.by_jurisdiction: dict[str, list[Indicator]] = defaultdict(list)
+        for ind in indicators:
+            if not self.catalog[ind.id]["overlay"]:
+                self.by_jurisdiction[ind.jurisdiction].append(ind)
+        self._overlays: dict[str, list[dict]] = {}
+        self._scorecards: dict[str, dict] = {}
+
+    def overlay(self, overlay_id: str) -> list[dict]:
+        """All entries of an overlay indicator, sorted once and shared by every page."""
+        if overlay_id not in self._overlays:
+            self._overlays[overlay_id] = _overlay_all(self.by_id[overlay_id])
+        return self._overlays[overlay_id]
+
+    def government_overlay(self, jurisdiction: str) -> str | None:
+        """
+        The overlay indicator listing the jurisdiction's governments: the one
+        its directed graphs overlay most often.
+        """
+        counts: dict[str, int] = defaultdict(int)
+        for ind in self.by_jurisdiction[jurisdiction]:
+            for g in self.catalog[ind.id]["graphs"]:
+                if g["direction"] and g["overlay_metric"] in self.by_id:
+                    counts[g["overlay_metric"]] += 1
+        if not counts:
+            return None
+        return min(counts, key=lambda o: (-counts[o], o))
+
+    def scorecard(self, jurisdiction: str) -> dict | None:
+        """The jurisdiction's governments × indicators matrix, computed once."""
+        if jurisdiction not in self._scorecards:
+            overlay_id = self.government_overlay(jurisdiction)
+            overlay = self.overlay(overlay_id) if overlay_id else []
+            self._scorecards[jurisdiction] = (
+                _scorecard(overlay, self.by_jurisdiction[jurisdiction], overlay_id)
+                if overlay else None
+            )
+        return self._scorecards[jurisdiction]
+
+
+def _slug(jurisdiction: str) -> str:
+    return jurisdiction.lower().replace(" ", "_")
+
+
+def _index_context(site: _Site) -> dict:
+    return dict(jurisdictions=sorted(site.by_jurisdiction.keys()), page_id="index")
+
+
+def _jurisdiction_context(site: _Site, jurisdiction: str) -> dict:
+    slug = _slug(jurisdiction)
+
+    by_cat: dict[str, list[dict]] = defaultdict(list)
+    for ind in sorted(site.by_jurisdiction[jurisdiction], key=lambda i: i.title):
+        entry = site.catalog[ind.id]
+        if not entry["graphs"]:
+            continue
+        first = entry["graphs"][0]
+
+        by_cat[entry["category"]].append({
+            "id":           ind.id,
+            "title":        entry["title"],
+            "url":          f"{slug}_{ind.id}.html",
+            **tail_summary(entry["tail"], first["direction"]),
+            "latest_value": first["latest_value"],
+            "latest_date":  first["last"],
+            "y_label":      first["y"],
+        })
+
+    return dict(jurisdiction=jurisdiction,
                 slug=slug,
                 categories=dict(sorted(by_cat.items())),
+                has_scorecard=site.scorecard(jurisdiction) is not None,
                 page_id="jurisdiction")
 
-        # ── Indicator detail pages ─────────────────────────────────────────────
+
+def _scorecard_context(site: _Site, jurisdiction: str) -> dict:
+    return dict(jurisdiction=jurisdiction,
+                slug=_slug(jurisdiction),
+                scorecard=site.scorecard(jurisdiction),
+                page_id="scorecard")
+
+
+def _government_context(site: _Site, jurisdiction: str, index: int) -> dict:
+    scorecard = site.scorecard(jurisdiction)
+    government = next(g for g in scorecard["governments"] if g["index"] == index)
+    return dict(jurisdiction=jurisdiction,
+                slug=_slug(jurisdiction),
+                government=government,
+                rows=[
+                    {**ind, "cell": cell}
+                    for ind, cell in zip(scorecard["indicators"], government["cells"])
+                ],
+                page_id="government")
+
+
+def _indicator_context(site: _Site, ind_id: str) -> dict:
+    ind = site.by_id[ind_id]
+    by_id = site.by_id
+
+    graphs: list[dict] = []
+    overlays: dict[str, str] = {}   # overlay id -> data file URL
+
+    for i, graph in enumerate(ind.chart_graphs):
+        overlay_id = graph.get("overlay_metric")
+
+        # Windowed overlay for chart display, one file shared by every page
+        if overlay_id and overlay_id in by_id and overlay_id not in overlays:
+            overlays[overlay_id] = _write_asset(
+                site.out_dir, overlay_id, _overlay_windowed(by_id[overlay_id], site.cutoff),
+            )
+
+        # Full overlay for government performance bars
+        gov_perf = None
+        if overlay_id and overlay_id in by_id and graph.get("direction"):
+            gov_perf = _gov_performance(graph, site.overlay(overlay_id))
+
+        levels = _chart_series(graph, site.cutoff, site.chart_points, site.zoom_levels)
+        graphs.append({
+            "title":       graph.get("title", ""),
+            "y_label":     graph.get("y", ""),
+            "direction":   graph.get("direction", ""),
+            "overlay_id":  overlay_id,
+            "levels":      [
+                _write_chunks(site.out_dir, f"{ind.id}-{i}-{n}", points)
+                for n, points in enumerate(levels)
+            ],
+            "zoomable":    len(levels) > 1,
+            "gov_perf":    gov_perf,
+        })
+
+    table_headers, table = _table_data(ind)
+    table_url = _write_asset(site.out_dir, f"{ind.id}-table", table) if table else None
+
+    return dict(jurisdiction=ind.jurisdiction,
+                slug=_slug(ind.jurisdiction),
+                ind=ind,
+                graphs=graphs,
+                overlays=overlays,
+                table_headers=table_headers,
+                table_url=table_url,
+                table_rows=len(table["dates"]) if table else 0,
+                table_page_size=TABLE_PAGE_SIZE,
+                assets=sorted({
+                    *overlays.values(),
+                    *([table_url] if table_url else []),
+                    *(c["url"] for g in graphs for level in g["levels"] for c in level),
+                }),
+                page_id="indicator")
+
+
+_CONTEXTS = {
+    "index":        _index_context,
+    "jurisdiction": _jurisdiction_context,
+    "indicator":    _indicator_context,
+    "scorecard":    _scorecard_context,
+    "government":   _government_context,
+}
+
+
+Page = tuple[str, str, str, str, tuple]   # (kind, template, output path, input key, context args)
+
+
+Rendered = tuple[str, list[str], bool, int, int]
+
+
+def _render_page(env: jinja2.Environment, site: _Site, page: Page) -> Rendered:
+    """
+    Render one page; returns its path, the data files (ASSETS_DIR URLs) it
+    loads, whether the file on disk changed, and its size before and after
+    minifying.
+    """
+    kind, template, path, _, ctx_args = page
+    ctx = _CONTEXTS[kind](site, *ctx_args)
+    assets = ctx.pop("assets", [])
+    ctx["static"] = site.static
+    return path, assets, *_render(env, template, path, minified=site.minified, **ctx)
+
+
+# ── worker processes ──────────────────────────────────────────────────────────
+#
+# Each worker receives the loaded site once, when it starts (inherited on fork,
+# pickled once per worker elsewhere), and builds its own Jinja2 environment.
+# Tasks then carry only the page tuple, so no worker re-reads any YAML.
+
+_worker: tuple[jinja2.Environment, _Site] | None = None
+
+
+def _init_worker(site: _Site, compiled: str | None) -> None:
+    global _worker
+    _worker = (_env(compiled), site)
+
+
+def _render_in_worker(page: Page) -> Rendered:
+    env, site = _worker
+    return _render_page(env, site, page)
+
+
+# ── incremental build ─────────────────────────────────────────────────────────
+
+def _hash(*parts: object) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _file_hash(path: Path, _memo: dict[Path, str] = {}) -> str:
+    if path not in _memo:
+        _memo[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return _memo[path]
+
+
+def _template_chain(env: jinja2.Environment, name: str) -> list[str]:
+    """`name` plus every template it extends, includes or imports, recursively."""
+    chain: list[str] = []
+    todo = [name]
+    while todo:
+        current = todo.pop()
+        if current in chain:
+            continue
+        chain.append(current)
+        source = env.loader.get_source(env, current)[0]
+        todo.extend(
+            ref for ref in jinja2.meta.find_referenced_templates(env.parse(source))
+            if ref is not None
+        )
+    return sorted(chain)
+
+
+def _template_hash(env: jinja2.Environment, name: str) -> str:
+    return _hash([(t, env.loader.get_source(env, t)[0]) for t in _template_chain(env, name)])
+
+
+def _plan(env: jinja2.Environment, site: _Site, out_dir: str) -> list[Page]:
+    """
+    (kind, template, output path, input key, context args) for every page.
+
+    The key hashes everything the page is built from: the page template and
+    the templates it inherits from, the renderer's own source (and whether it
+    minifies), the hashed URLs of the static assets, the build settings it
+    depends on, and the YAML of each indicator it shows (including
+    overlay indicators referenced via overlay_metric).
+    """
+    code = _hash([_file_hash(Path(__file__).parent / src) for src in RENDER_SOURCES],
+                 site.minified, site.static)
+    tmpl = {t: _template_hash(env, t) for t in (
+        "index.jinja", "jurisdiction.jinja", "indicator.jinja", "scorecard.jinja", "government.jinja",
+    )}
+
+    pages = [(
+        "index", "index.jinja", f"{out_dir}/index.html",
+        _hash(code, tmpl["index.jinja"], sorted(site.by_jurisdiction)),
+        (),
+    )]
+
+    for jurisdiction, inds in sorted(site.by_jurisdiction.items()):
+        slug = _slug(jurisdiction)
+        pages.append((
+            "jurisdiction", "jurisdiction.jinja", f"{out_dir}/{slug}.html",
+            _hash(code, tmpl["jurisdiction.jinja"], jurisdiction,
+                  sorted((ind.id, site.catalog[ind.id]["sha256"]) for ind in inds),
+                  site.government_overlay(jurisdiction)),
+            (jurisdiction,),
+        ))
+
         for ind in inds:
-            cg = ind.chart_graphs
-            if not cg:
+            entry = site.catalog[ind.id]
+            if not entry["graphs"]:
+                continue
+            overlay_ids = [o for o in entry["depends_on"] if o in site.by_id]
+            pages.append((
+                "indicator", "indicator.jinja", f"{out_dir}/{slug}_{ind.id}.html",
+                _hash(code, tmpl["indicator.jinja"], CHART_YEARS, site.cutoff,
+                      site.chart_points, site.zoom_levels,
+                      entry["sha256"],
+                      [(o, site.catalog[o]["sha256"]) for o in overlay_ids]),
+                (ind.id,),
+            ))
+
+        scorecard = site.scorecard(jurisdiction)
+        if scorecard is None:
+            continue
+        overlay_id = site.government_overlay(jurisdiction)
+        inputs = [(o, site.catalog[o]["sha256"])
+                  for o in sorted({overlay_id, *(i["id"] for i in scorecard["indicators"])})]
+        pages.append((
+            "scorecard", "scorecard.jinja", f"{out_dir}/{slug}_scorecard.html",
+            _hash(code, tmpl["scorecard.jinja"], inputs),
+            (jurisdiction,),
+        ))
+        for gov in scorecard["governments"]:
+            pages.append((
+                "government", "government.jinja", f"{out_dir}/{slug}_gov_{gov['index']}.html",
+                _hash(code, tmpl["government.jinja"], gov["index"], inputs),
+                (jurisdiction, gov["index"]),
+            ))
+
+    return pages
+
+
+def _manifest_key(out_dir: str) -> str:
+    return hashlib.sha1(os.path.abspath(out_dir).encode()).hexdigest()
+
+
+def _manifest_path(out_dir: str) -> Path:
+    return MANIFEST_DIR / f"{_manifest_key(out_dir)}.json"
+
+
+def _deploy_manifest_path(out_dir: str) -> Path:
+    return MANIFEST_DIR / f"{_manifest_key(out_dir)}.deploy.json"
+
+
+def _load_manifest(out_dir: str) -> tuple[dict[str, str], dict[str, list[str]]]:
+    """(output path -> input key, output path -> data files it loads) from the last build."""
+    try:
+        manifest = json.loads(_manifest_path(out_dir).read_text(encoding="utf-8"))
+        return manifest["outputs"], manifest.get("assets", {})
+    except (OSError, ValueError, KeyError):
+        return {}, {}
+
+
+def _save_manifest(out_dir: str, outputs: dict[str, str], assets: dict[str, list[str]]) -> None:
+    atomicfile.write_text(
+        _manifest_path(out_dir),
+        json.dumps({"output_dir": os.path.abspath(out_dir), "outputs": outputs, "assets": assets},
+                   indent=1, sort_keys=True),
+    )
+
+
+def _remove_unused_assets(out_dir: str, assets: dict[str, list[str]]) -> int:
+    """Delete data files no current page loads; returns how many were removed."""
+    used = {url for urls in assets.values() for url in urls}
+    removed = 0
+    for path in sorted(Path(out_dir, ASSETS_DIR).glob("*.json")):
+        if f"{ASSETS_DIR}/{path.name}" not in used:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+# ── precompression ────────────────────────────────────────────────────────────
+
+_COMPRESSORS = {".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+if brotli is not None:
+    _COMPRESSORS[".br"] = lambda data: brotli.compress(data, quality=11)
+
+
+def _compress_file(path: Path) -> int:
+    """
+    Write `path`.gz (and `path`.br when brotli is installed) at maximum
+    compression, stamped with the source's mtime; a sibling that already
+    carries that mtime is up to date and skipped. Returns siblings written.
+    """
+    mtime = path.stat().st_mtime_ns
+    data = None
+    written = 0
+    for suffix, compress in _COMPRESSORS.items():
+        target = path.with_name(path.name + suffix)
+        try:
+            if target.stat().st_mtime_ns == mtime:
                 continue
+        except FileNotFoundError:
+            pass
+        if data is None:
+            data = path.read_bytes()
+        atomicfile.write_bytes(target, compress(data))
+        os.utime(target, ns=(mtime, mtime))
+        written += 1
+    return written
+
+
+def _precompress(out_dir: str, min_bytes: int, jobs: int) -> tuple[int, int]:
+    """
+    Precompress every text file of at least `min_bytes` in the output directory
+    and delete siblings whose source is gone or now below the threshold.
+    Returns (siblings written, siblings removed).
+    """
+    root = Path(out_dir)
+    sources, removed = [], 0
+    for path in sorted(root.rglob("*")):
+        if not path.is_file():
+            continue
+        if path.suffix in _COMPRESSORS:
+            source = path.with_suffix("")
+            if not source.is_file() or source.stat().st_size < min_bytes:
+                path.unlink()
+                removed += 1
+        elif path.suffix in COMPRESS_SUFFIXES and path.stat().st_size >= min_bytes:
+            sources.append(path)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:   # zlib and brotli release the GIL
+        written = sum(pool.map(_compress_file, sources))
+    return written, removed
+
+
+# ── deploy manifest ───────────────────────────────────────────────────────────
+
+def _site_hashes(out_dir: str) -> dict[str, str]:
+    """Site-relative path -> SHA-256 of every file in the output directory."""
+    root = Path(out_dir)
+    return {
+        path.relative_to(root).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and not path.name.startswith(".tmp-")
+    }
+
+
+def _write_deploy_manifest(out_dir: str, manifest_path: str | Path) -> dict[str, list[str]]:
+    """
+    Write {"files": {path: sha256}, "diff": {"added", "changed", "removed"}}
+    to `manifest_path`, diffed against the manifest already there, so the
+    deploy step can upload only what changed. Returns the diff.
+    """
+    try:
+        before = json.loads(Path(manifest_path).read_text(encoding="utf-8"))["files"]
+    except (OSError, ValueError, KeyError):
+        before = {}
+    files = _site_hashes(out_dir)
+    diff = {
+        "added":   sorted(p for p in files if p not in before),
+        "changed": sorted(p for p in files if p in before and before[p] != files[p]),
+        "removed": sorted(p for p in before if p not in files),
+    }
+    with atomicfile.replacing(manifest_path) as f:
+        json.dump({"files": files, "diff": diff}, f, indent=1, sort_keys=True)
+    return diff
+
+
+# ── main ──────────────────────────────────────────────────────────────────────
+
+def _print_minify_report(sizes: dict[str, list[int]]) -> None:
+    """Bytes saved by --minify over the pages rendered this build, per page kind."""
+    if not sizes:
+        return
+    print("minify:")
+    for kind, (count, size_in, size_out) in sorted(sizes.items()):
+        saved = size_in - size_out
+        pct = 100 * saved / size_in if size_in else 0.0
+        print(f"  {kind:<12} {count:>4} page(s) {size_in:>11,} -> {size_out:>11,} bytes "
+              f"({saved:,} saved, {pct:.1f}%)")
+
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return n
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the static site from data/.")
+    parser.add_argument("output_dir", nargs="?", default=OUTPUT_DIR,
+                        help=f"directory to write the site to (default {OUTPUT_DIR})")
+    parser.add_argument("--full", action="store_true",
+                        help="re-render every page instead of only those whose inputs changed")
+    parser.add_argument("--jobs", type=_positive_int, default=DEFAULT_JOBS, metavar="N",
+                        help=f"render pages in N worker processes (default {DEFAULT_JOBS})")
+    parser.add_argument("--chart-points", type=int, default=CHART_POINTS, metavar="N",
+                        help=f"downsample charts to about N points (default {CHART_POINTS}, 0 = every point)")
+    parser.add_argument("--zoom-levels", type=_positive_int, default=ZOOM_LEVELS, metavar="N",
+                        help="chart resolutions to embed; the page switches to finer ones on zoom "
+                             f"(default {ZOOM_LEVELS})")
+    parser.add_argument("--minify", action="store_true",
+                        help="strip redundant whitespace from pages as they render "
+                             "(<pre> and <textarea> kept verbatim) and report bytes saved")
+    parser.add_argument("--compress", action="store_true",
+                        help="write precompressed .gz (and .br, if brotli is installed) siblings "
+                             "of HTML, JSON, SVG, CSS and JS files")
+    parser.add_argument("--compress-min-bytes", type=int, default=COMPRESS_MIN_BYTES, metavar="N",
+                        help=f"only precompress files of at least N bytes (default {COMPRESS_MIN_BYTES})")
+    parser.add_argument("--deploy-manifest", metavar="PATH",
+                        help="where to write the path -> hash manifest of the built site and its "
+                             f"diff against the previous one (default {MANIFEST_DIR}/"
+                             "<output directory key>.deploy.json)")
+    templates = parser.add_mutually_exclusive_group()
+    templates.add_argument("--precompile", metavar="DIR",
+                           help="compile the templates into Python modules in DIR and exit")
+    templates.add_argument("--compiled", metavar="DIR",
+                           help="render with templates precompiled into DIR")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    if args.precompile:
+        _precompile(args.precompile)
+        return
+    if args.compiled:
+        _check_compiled(args.compiled)
+
+    out_dir = args.output_dir
+    env = _env(args.compiled)
+    os.makedirs(out_dir, exist_ok=True)
+
+    site = _Site(load_all(), _cutoff(),
+                 args.chart_points, args.zoom_levels, out_dir, args.minify,
+                 _static_assets(out_dir))
+    pages = _plan(_env(), site, out_dir)
+
+    previous, previous_assets = ({}, {}) if args.full else _load_manifest(out_dir)
+    outputs = {path: key for _, _, path, key, _ in pages}
+    todo = [
+        page for page in pages
+        if previous.get(page[2]) != page[3]
+        or not os.path.exists(page[2])
+        or not all(Path(out_dir, url).exists() for url in previous_assets.get(page[2], []))
+    ]
+    skipped = len(pages) - len(todo)
+
+    # Pages are independent, so their order of completion does not matter;
+    # results come back in plan order so the log matches a serial build.
+    assets = {path: previous_assets.get(path, []) for path in outputs}
+    if args.jobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(todo)),
+                                 initializer=_init_worker, initargs=(site, args.compiled)) as pool:
+            rendered = list(pool.map(_render_in_worker, todo))
+    else:
+        rendered = [_render_page(env, site, page) for page in todo]
+    identical = 0
+    sizes: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])   # kind -> pages, bytes in, out
+    for page, (path, page_assets, written, size_in, size_out) in zip(todo, rendered):
+        assets[path] = page_assets
+        if written:
+            print(f"  {path}")
+        else:
+            identical += 1
+        totals = sizes[page[0]]
+        totals[0] += 1
+        totals[1] += size_in
+        totals[2] += size_out
+
+    # Pages from an earlier build that no longer exist (e.g. removed indicators)
+    removed = 0
+    for path in sorted(set(previous) - set(outputs)):
+        if os.path.exists(path):
+            os.remove(path)
+            removed += 1
+            print(f"  removed {path}")
+    stale_assets = _remove_unused_assets(out_dir, assets)
+
+    _save_manifest(out_dir, outputs, assets)
+    summary = f"{len(pages) - skipped} page(s) rendered, {skipped} unchanged, {removed} removed"
+    if identical:
+        summary += f" ({identical} rendered identical and left untouched)"
+    if stale_assets:
+        summary += f", {stale_assets} unused data file(s) deleted"
+    print(summary)
+    if args.minify:
+        _print_minify_report(sizes)
+
+    if args.compress:
+        written, dropped = _precompress(out_dir, args.compress_min_bytes, args.jobs)
+        formats = ", ".join(sorted(_COMPRESSORS))
+        print(f"compressed: {written} file(s) written ({formats}), {dropped} stale removed")
 
-            graphs: list[dict] = []
-            overlays: dict[str, list[dict]] = {}
-
-            for graph in cg:
-                overlay_id = graph.get("overlay_metric")
-
-                # Windowed overlay for chart display
-                if overlay_id and overlay_id in by_id and overlay_id not in overlays:
-                    overlays[overlay_id] = _overlay_windowed(by_id[overlay_id], cutoff)
-
-                # Full overlay for government performance bars
-                gov_perf = None
-                if overlay_id and overlay_id in by_id and graph.get("direction"):
-                    gov_perf = _gov_performance(graph, _overlay_all(by_id[overlay_id]))
-
-                graphs.append({
-                    "title":       graph.get("title", ""),
-                    "y_label":     graph.get("y", ""),
-                    "direction":   graph.get("direction", ""),
-                    "overlay_id":  overlay_id,
-                    "series":      _chart_series(graph, cutoff),
-                    "gov_perf":    gov_perf,
-                })
-
-            table_headers, table_rows = _table_data(ind)
-
-            _render(env, "indicator.jinja",
-                    f"{OUTPUT_DIR}/{slug}_{ind.id}.html",
-                    jurisdiction=jurisdiction,
-                    slug=slug,
-                    ind=ind,
-                    graphs=graphs,
-                    overlays=overlays,
-                    table_headers=table_headers,
-                    table_rows=table_rows,
-                    page_id="indicator")
+    deploy_manifest = args.deploy_manifest or _deploy_manifest_path(out_dir)
+    diff = _write_deploy_manifest(out_dir, deploy_manifest)
+    print(f"deploy: {len(diff['added'])} added, {len(diff['changed'])} changed, "
+          f"{len(diff['removed'])} removed -> {deploy_manifest}")
 
 
 if __name__ == "__main__":
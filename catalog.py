@@ -0,0 +1,132 @@
+"""
+catalog.py — summary index of the indicator files in data/.
+
+`data/_catalog.json` holds one entry per indicator file, keyed by file name:
+its SHA-256, the top-level fields, whether it is an overlay, the indicators
+it overlays (`depends_on`) and, for each charted graph, its axis fields, point
+count and first / latest date and value, plus the tail of the first graph
+(metrics.tail(), from which build.py draws the RAG dot and sparkline). That is
+everything the home and jurisdiction pages, the staleness report and page
+invalidation need, so none of them parse YAML:
+
+    {"version": 2, "indicators": {"au_cash_rate.yaml": {"sha256": ..., "id": ..., ...}}}
+
+Only `Indicator.save()` writes the catalog, rewriting its own entry after
+every save. `refresh()` checks entries against their file's hash (reading, not
+parsing, the file) and rebuilds, in memory, those of files that were edited by
+hand or added; `python catalog.py` writes a fully refreshed catalog, e.g.
+after VERSION changes. The file is sorted and indented so that changes to it
+diff cleanly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import atomicfile
+from metrics import tail
+from series import Series
+
+CATALOG_NAME = "_catalog.json"
+VERSION      = 2   # bump when entries change shape or meaning
+
+_FIELDS = ("id", "jurisdiction", "title", "category", "frequency", "collector")
+
+
+def _path(data_dir: Path) -> Path:
+    return data_dir / CATALOG_NAME
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def entry(ind: Any, sha256: str) -> dict:
+    """The catalog entry of an Indicator whose file hashes to `sha256`."""
+    graphs = []
+    for g in ind.chart_graphs:
+        data: Series = g.get("data", Series())
+        first, latest = data.first(), data.latest()
+        graphs.append({
+            "title":          g.get("title", ""),
+            "y":              g.get("y", ""),
+            "direction":      g.get("direction", ""),
+            "overlay_metric": g.get("overlay_metric"),
+            "points":         len(data),
+            "first":          first[0] if first else None,
+            "last":           latest[0] if latest else None,
+            "latest_value":   latest[1] if latest else None,
+        })
+
+    last_updated = ind.last_updated
+    return {
+        "sha256":       sha256,
+        **{field: getattr(ind, field) for field in _FIELDS},
+        "last_updated": last_updated.isoformat() if last_updated else None,
+        "overlay":      ind.is_overlay,
+        "depends_on":   sorted({g["overlay_metric"] for g in graphs if g["overlay_metric"]}),
+        "graphs":       graphs,
+        "tail":         tail(ind.chart_graphs[0].get("data", Series())) if graphs else [],
+    }
+
+
+def load(data_dir: Path) -> dict[str, dict]:
+    """File name -> entry, as last written ({} if missing, unreadable or outdated)."""
+    try:
+        doc = json.loads(_path(data_dir).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(doc, dict) or doc.get("version") != VERSION:
+        return {}
+    return doc.get("indicators", {})
+
+
+def _write(data_dir: Path, entries: dict[str, dict]) -> None:
+    body = json.dumps({"version": VERSION, "indicators": entries},
+                      indent=1, sort_keys=True, ensure_ascii=False) + "\n"
+    atomicfile.write_text(_path(data_dir), body)
+
+
+def refresh(paths: Iterable[Path], open_indicator: Callable[[Path], Any]) -> dict[str, dict]:
+    """
+    Entries for exactly `paths` (all in one directory), rebuilding the entry of
+    any file whose hash changed with `open_indicator(path)`. Nothing is written.
+    """
+    paths = list(paths)
+    if not paths:
+        return {}
+    stored = load(paths[0].parent)
+    entries = {}
+    for path in paths:
+        digest = _sha256(path)
+        e = stored.get(path.name)
+        if e is None or e["sha256"] != digest:
+            e = entry(open_indicator(path), digest)
+        entries[path.name] = e
+    return entries
+
+
+def rebuild(data_dir: Path, open_indicator: Callable[[Path], Any]) -> dict[str, dict]:
+    """Refresh the entries of every indicator file in `data_dir` and write them."""
+    entries = refresh(sorted(data_dir.glob("*.yaml")), open_indicator)
+    _write(data_dir, entries)
+    return entries
+
+
+def update(ind: Any) -> dict:
+    """Rewrite (and return) the entry of an Indicator just saved to its file."""
+    data_dir = ind.path.parent
+    entries = load(data_dir)
+    entries[ind.path.name] = entry(ind, _sha256(ind.path))
+    _write(data_dir, entries)
+    return entries[ind.path.name]
+
+
+if __name__ == "__main__":
+    from update import Indicator
+
+    entries = rebuild(Path("data"), Indicator)
+    print(f"{len(entries)} indicator(s) -> {_path(Path('data'))}")
@@ -6,11 +6,13 @@ Scrapes the RBA cash rate table which lists each board decision date and the
 resulting cash rate. Returns all decisions from the last 24 months.
 
 Dates are recorded as the actual RBA board decision date (not end-of-month).
+
+Run from the repository root with `python -m collectors.au_cash_rate`.
 """
 
 import re
-import ssl
-import urllib.request
+
+from collectors.client import fetch
 
 
 _MONTHS = {
@@ -21,14 +23,11 @@ _MONTHS = {
 
 def collect() -> list[tuple]:
     url = "https://www.rba.gov.au/statistics/cash-rate/"
-    req = urllib.request.Request(url, headers={
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-    })
     # RBA's certificate chain is not trusted by Python's default SSL on Windows;
     # unverified context is acceptable for a read-only public data scraper.
-    ctx = ssl._create_unverified_context()
-    with urllib.request.urlopen(req, timeout=15, context=ctx) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    html = fetch(url, headers={
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    }, timeout=15, verify=False).decode("utf-8", errors="ignore")
 
     # Table rows contain: "19 Mar 2026" and "4.10" in adjacent cells
     # Match date strings like "4 Feb 2026" or "18 Mar 2026"
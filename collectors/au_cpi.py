@@ -10,11 +10,14 @@ Index uses 2011-12 = 100 base period.
 FRAGILE: ABS page structure changes break this scraper. If it fails, visit the
 ABS page above and update data.csv manually. The quarterly CPI is released in
 late January, April, July, and October for the preceding quarter.
+
+Run from the repository root with `python -m collectors.au_cpi`.
 """
 
 import calendar
 import re
-import urllib.request
+
+from collectors.client import fetch
 
 
 _QUARTER_END = {1: "03-31", 2: "06-30", 3: "09-30", 4: "12-31"}
@@ -26,12 +29,10 @@ _MONTHS_Q = {
 
 def collect() -> list[tuple]:
     url = "https://www.abs.gov.au/statistics/economy/price-indexes-and-inflation/consumer-price-index-australia/latest-release"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=20) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=20).decode("utf-8", errors="ignore")
 
     # Find annual rate like "rose 2.4%" and quarter like "December quarter 2025"
     rate_m = re.search(r"(?:rose|fell|increased|decreased)\s+(\d+\.?\d*)%", html, re.IGNORECASE)
@@ -7,10 +7,13 @@ Released approximately: March (Dec qtr), June (Mar qtr), Sep (Jun qtr), Dec (Sep
 
 FRAGILE: ABS page structure changes break this scraper. If it fails, visit the
 ABS page above and update data.csv manually.
+
+Run from the repository root with `python -m collectors.au_gdp`.
 """
 
 import re
-import urllib.request
+
+from collectors.client import fetch
 
 
 _QUARTER_END = {"march": "03-31", "june": "06-30", "september": "09-30", "december": "12-31"}
@@ -18,12 +21,10 @@ _QUARTER_END = {"march": "03-31", "june": "06-30", "september": "09-30", "decemb
 
 def collect() -> list[tuple]:
     url = "https://www.abs.gov.au/statistics/economy/national-accounts/australian-national-accounts-national-income-expenditure-and-product/latest-release"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=20) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=20).decode("utf-8", errors="ignore")
 
     # "rose 0.8% in the [quarter] to [Month] quarter [Year]"
     # or "rose 0.8% in seasonally adjusted... December 2025"
@@ -9,10 +9,13 @@ downloadable Excel table. This collector returns the mean price from the page.
 
 FRAGILE: ABS page structure changes break this scraper. If it fails, visit the
 ABS page above and update data.csv manually.
+
+Run from the repository root with `python -m collectors.au_house_price`.
 """
 
 import re
-import urllib.request
+
+from collectors.client import fetch
 
 
 _QUARTER_MAP = {
@@ -22,12 +25,10 @@ _QUARTER_MAP = {
 
 def collect() -> list[tuple]:
     url = "https://www.abs.gov.au/statistics/economy/price-indexes-and-inflation/total-value-dwellings/latest-release"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=20) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=20).decode("utf-8", errors="ignore")
 
     # Look for "$X,XXX,XXX" or "$X.XXX" million pattern + quarter
     price_m = re.search(r"\$\s*(\d[\d,]+)", html)
@@ -10,11 +10,14 @@ the unemployment rate [increased/decreased/remained] ... to {X.X}%"
 
 FRAGILE: ABS page wording changes break this scraper. If it fails, get the
 latest rate from the ABS page above and add a row manually.
+
+Run from the repository root with `python -m collectors.au_unemployment`.
 """
 
 import calendar
 import re
-import urllib.request
+
+from collectors.client import fetch
 
 
 _MONTHS = {
@@ -30,12 +33,10 @@ def _month_end(year: int, month: int) -> str:
 
 def collect() -> list[tuple]:
     url = "https://www.abs.gov.au/statistics/labour/employment-and-unemployment/labour-force-australia/latest-release"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=20) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=20).decode("utf-8", errors="ignore")
 
     # Month/year: "in April 2026" in key statistics section
     month_m = re.search(
@@ -12,10 +12,13 @@ Page structure (as of 2026):
 
 FRAGILE: ABS page wording changes break this scraper. If it fails, visit the
 ABS page above and update the YAML manually.
+
+Run from the repository root with `python -m collectors.au_wpi`.
 """
 
 import re
-import urllib.request
+
+from collectors.client import fetch
 
 
 _QUARTER_MAP = {
@@ -25,12 +28,10 @@ _QUARTER_MAP = {
 
 def collect() -> list[tuple]:
     url = "https://www.abs.gov.au/statistics/economy/price-indexes-and-inflation/wage-price-index-australia/latest-release"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=20) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=20).decode("utf-8", errors="ignore")
 
     # Annual growth: "WPI rose 3.3%" — WPI is the anchor, not "twelve months"
     annual_m = re.search(
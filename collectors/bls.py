@@ -0,0 +1,103 @@
+"""BLS public API access shared by the us_* collectors.
+
+Collectors list the series they read in a module-level `BLS_SERIES` tuple and
+call `series(series_id)` for the observations. Before collectors run,
+update.py gathers `BLS_SERIES` from every stale indicator and calls
+`prefetch()`, which requests all of them in a single POST (the v1 API takes up
+to 25 series per query); `series()` then hands each collector its slice of
+that response. A series that was not prefetched — e.g. when a collector is run
+by hand — falls back to its own request.
+
+Collectors called with `since` (the indicator's last_updated) pass a
+`startyear` so only the years since the last update are requested. Without one
+the API's default window of the last three years is used.
+
+Observations are returned exactly as the API sends them:
+    {"year": "2026", "period": "M03", "periodName": "March", "value": "319.8", ...}
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import date
+from typing import Iterable
+
+from collectors.client import fetch
+
+API_URL = "https://api.bls.gov/publicAPI/v1/timeseries/data/"
+MAX_SERIES_PER_REQUEST = 25
+MAX_YEARS_PER_REQUEST  = 10
+DEFAULT_YEARS          = 3
+
+_HEADERS = {"User-Agent": "political-data-collector/1.0"}
+
+# series id -> (first year covered, observations)
+_prefetched: dict[str, tuple[int, list[dict]]] = {}
+_lock = threading.Lock()
+
+
+def _window(startyear: int | None) -> tuple[int, int]:
+    """(startyear, endyear) to request, clamped to what one query may span."""
+    end = date.today().year
+    start = end - DEFAULT_YEARS + 1 if startyear is None else startyear
+    return max(start, end - MAX_YEARS_PER_REQUEST + 1), end
+
+
+def _results(data: dict) -> list[dict]:
+    if data.get("status") != "REQUEST_SUCCEEDED":
+        message = "; ".join(data.get("message") or []) or data.get("status", "unknown error")
+        raise RuntimeError(f"BLS API: {message}")
+    return data["Results"]["series"]
+
+
+def _post(series_ids: list[str], start: int, end: int, timeout: float) -> list[dict]:
+    body = json.dumps({
+        "seriesid":  series_ids,
+        "startyear": str(start),
+        "endyear":   str(end),
+    }).encode()
+    data = json.loads(fetch(
+        API_URL,
+        headers={**_HEADERS, "Content-Type": "application/json"},
+        data=body,
+        timeout=timeout,
+    ))
+    return _results(data)
+
+
+def prefetch(requests: Iterable[tuple[str, int | None]], timeout: float = 30) -> None:
+    """
+    Fetch every (series_id, startyear) in as few multi-series requests as the
+    API allows. One year range — the earliest start asked for — covers them all.
+    """
+    requests = list(requests)
+    if not requests:
+        return
+    start, end = min(_window(y) for _, y in requests)
+    with _lock:
+        wanted = sorted({
+            sid for sid, _ in requests
+            if sid not in _prefetched or _prefetched[sid][0] > start
+        })
+    for i in range(0, len(wanted), MAX_SERIES_PER_REQUEST):
+        results = _post(wanted[i:i + MAX_SERIES_PER_REQUEST], start, end, timeout)
+        with _lock:
+            for s in results:
+                _prefetched[s["seriesID"]] = (start, s["data"])
+
+
+def series(series_id: str, startyear: int | None = None, timeout: float = 15) -> list[dict]:
+    """
+    Observations for `series_id` from `startyear` on (default: the API's
+    three-year window), taken from the prefetched batch when it covers them.
+    """
+    start, end = _window(startyear)
+    with _lock:
+        hit = _prefetched.get(series_id)
+    if hit is not None and hit[0] <= start:
+        return [item for item in hit[1] if int(item["year"]) >= start]
+    if startyear is None:
+        data = json.loads(fetch(API_URL + series_id, headers=_HEADERS, timeout=timeout))
+        return _results(data)[0]["data"]
+    return _post([series_id], start, end, timeout)[0]["data"]
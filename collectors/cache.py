@@ -0,0 +1,96 @@
+"""On-disk response cache for collector fetches.
+
+Entries are content-addressed: the file name is the SHA-256 of the request
+(method, URL, headers and body), so the same request made by any collector or
+run maps to the same entry. Each file holds one JSON line of metadata followed
+by the decoded response body.
+
+Freshness is decided by the caller's TTL (update.py derives it from the
+indicator's `frequency`). A hit bumps the file's mtime, and after every write
+the least recently used entries are evicted until the cache fits in
+MAX_BYTES. Writes go to a temporary file and are renamed into place, so
+concurrent writers — threads or separate update.py runs — never expose a
+partial entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import atomicfile
+
+CACHE_DIR = Path(".cache") / "responses"
+MAX_BYTES = 64 * 1024 * 1024
+
+_evict_lock = threading.Lock()
+
+
+def key(method: str, url: str, headers: dict[str, str], body: bytes | None = None) -> str:
+    h = hashlib.sha256()
+    h.update(f"{method} {url}\n".encode())
+    for name, value in sorted((k.lower(), v) for k, v in headers.items()):
+        h.update(f"{name}: {value}\n".encode())
+    h.update(b"\n")
+    h.update(body or b"")
+    return h.hexdigest()
+
+
+def _path(k: str) -> Path:
+    return CACHE_DIR / k[:2] / k
+
+
+def get(k: str, ttl: float | None) -> bytes | None:
+    """Cached body for `k` stored less than `ttl` seconds ago (any age if ttl is None)."""
+    path = _path(k)
+    try:
+        with open(path, "rb") as f:
+            meta = json.loads(f.readline())
+            body = f.read()
+    except (OSError, ValueError):
+        return None
+    if ttl is not None and time.time() - meta.get("stored", 0) > ttl:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return body
+
+
+def put(k: str, url: str, body: bytes) -> None:
+    path = _path(k)
+    meta = json.dumps({"url": url, "stored": time.time()}).encode()
+    with atomicfile.replacing(path, binary=True) as f:
+        f.write(meta + b"\n")
+        f.write(body)
+    _evict()
+
+
+def _evict() -> None:
+    with _evict_lock:
+        entries = []
+        total = 0
+        for path in CACHE_DIR.glob("*/*"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total <= MAX_BYTES:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= MAX_BYTES:
+                break
@@ -0,0 +1,368 @@
+"""Shared HTTP client for collector scripts.
+
+Collectors call `fetch()` instead of building their own urllib requests:
+
+    from collectors.client import fetch
+
+    html = fetch(url, headers={"Accept": "text/html"}).decode("utf-8", errors="ignore")
+
+The client keeps a small pool of persistent connections per host (several
+collectors hit abs.gov.au, tradingeconomics.com and api.bls.gov in the same
+run), asks for gzip/deflate bodies, and follows redirects. Like urllib, it
+honours the http_proxy / https_proxy / no_proxy environment variables: plain
+HTTP requests go to the proxy with the absolute URL, HTTPS requests through a
+CONNECT tunnel.
+
+Conditional GET: while update.py runs a collector inside `tracking(owner)`,
+requests carry If-None-Match / If-Modified-Since from validators stored by an
+earlier run, and a 304 reply raises `NotModified` so the collector stops with
+"no new data". New validators are held back until update.py calls `commit()`
+for that indicator (after the merge was saved), so a dry run or a failed merge
+never hides new data behind a 304 next time. Outside `tracking()` — e.g. when
+running a collector by hand with `python -m collectors.au_cpi` — requests are
+always unconditional.
+
+Response cache: fetches made inside `tracking(owner, ttl=...)` are also stored
+in the on-disk cache (collectors/cache.py) and reused for `ttl` seconds, so a
+rerun while debugging does not download the same pages again. `set_cache_mode`
+switches between "on" (default), "off" (never read or write the cache) and
+"only" (serve every tracked request from the cache regardless of age, never
+touch the network).
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import http.client
+import json
+import ssl
+import threading
+import urllib.error
+import urllib.request
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+from urllib.parse import (
+    SplitResult, parse_qsl, unquote, urlencode, urljoin, urlsplit, urlunsplit,
+)
+
+import atomicfile
+from collectors import cache
+
+CACHE_DIR       = Path(".cache")
+VALIDATORS_PATH = CACHE_DIR / "validators.json"
+
+MAX_REDIRECTS     = 5
+MAX_IDLE_PER_HOST = 4
+
+_REDIRECTS = {301, 302, 303, 307, 308}
+
+# Query parameters carrying credentials (e.g. FRED's api_key); dropped from
+# URLs before they are written anywhere under .cache/.
+_SECRET_PARAMS = {"api_key", "apikey", "registrationkey"}
+
+CACHE_ON   = "on"
+CACHE_OFF  = "off"
+CACHE_ONLY = "only"
+
+_cache_mode = CACHE_ON
+
+
+class NotModified(Exception):
+    """The server answered 304: nothing changed since the last committed fetch."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__(f"{url} not modified")
+        self.url = url
+
+
+# ── connection pool ───────────────────────────────────────────────────────────
+
+_PoolKey = tuple[str, str, bool]   # (scheme, netloc, verify)
+
+_pools: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+_pools_lock = threading.Lock()
+
+# Some hosts (e.g. the RBA) send a chain Python's default store does not trust
+# on every platform; collectors opt out per request with verify=False.
+_UNVERIFIED = ssl._create_unverified_context()
+
+
+def _proxy(scheme: str, netloc: str) -> SplitResult | None:
+    """The proxy urllib would use for `scheme`://`netloc`, or None."""
+    url = urllib.request.getproxies().get(scheme)
+    if not url or urllib.request.proxy_bypass(urlsplit(f"//{netloc}").hostname or netloc):
+        return None
+    return urlsplit(url if "://" in url else f"http://{url}")
+
+
+def _proxy_headers(proxy: SplitResult) -> dict[str, str]:
+    if proxy.username is None:
+        return {}
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode()).decode()}
+
+
+def _connect(key: _PoolKey, timeout: float) -> http.client.HTTPConnection:
+    scheme, netloc, verify = key
+    proxy = _proxy(scheme, netloc)
+    if scheme == "https":
+        if proxy is None:
+            return http.client.HTTPSConnection(
+                netloc, timeout=timeout, context=None if verify else _UNVERIFIED,
+            )
+        conn = http.client.HTTPSConnection(
+            proxy.hostname, proxy.port or 80, timeout=timeout,
+            context=None if verify else _UNVERIFIED,
+        )
+        conn.set_tunnel(netloc, headers=_proxy_headers(proxy))
+        return conn
+    if proxy is None:
+        return http.client.HTTPConnection(netloc, timeout=timeout)
+    return http.client.HTTPConnection(proxy.hostname, proxy.port or 80, timeout=timeout)
+
+
+def _checkout(key: _PoolKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+    """An idle pooled connection for `key` (reused=True) or a new one."""
+    with _pools_lock:
+        idle = _pools.get(key)
+        conn = idle.pop() if idle else None
+    if conn is None:
+        return _connect(key, timeout), False
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _checkin(key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+    with _pools_lock:
+        idle = _pools.setdefault(key, [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def close_all() -> None:
+    """Close every pooled connection."""
+    with _pools_lock:
+        conns = [c for idle in _pools.values() for c in idle]
+        _pools.clear()
+    for conn in conns:
+        conn.close()
+
+
+def _request(
+    method: str, url: str, headers: dict[str, str], body: bytes | None,
+    timeout: float, verify: bool,
+) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        raise ValueError(f"unsupported URL scheme: {url}")
+    key: _PoolKey = (parts.scheme, parts.netloc, verify)
+    target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    # A plain HTTP proxy takes the absolute URL (HTTPS goes through a tunnel).
+    proxy = _proxy(parts.scheme, parts.netloc) if parts.scheme == "http" else None
+    if proxy is not None:
+        target = urlunsplit(parts._replace(path=parts.path or "/", fragment=""))
+        headers = {**headers, **_proxy_headers(proxy)}
+
+    # A pooled connection may have been closed by the server while idle; that
+    # surfaces as a disconnect on first use, so retry once on a fresh socket.
+    while True:
+        conn, reused = _checkout(key, timeout)
+        try:
+            conn.request(method, target, body=body, headers=headers)
+            resp = conn.getresponse()
+            payload = resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+            conn.close()
+            if reused:
+                continue
+            raise urllib.error.URLError(exc) from exc
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise urllib.error.URLError(exc) from exc
+
+        if resp.will_close:
+            conn.close()
+        else:
+            _checkin(key, conn)
+        return resp.status, resp.reason, resp.headers, payload
+
+
+def _decode(payload: bytes, encoding: str | None) -> bytes:
+    encoding = (encoding or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(payload)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(payload)
+        except zlib.error:
+            # Some servers send a raw deflate stream without the zlib header.
+            return zlib.decompress(payload, -zlib.MAX_WBITS)
+    return payload
+
+
+# ── validators ────────────────────────────────────────────────────────────────
+
+_state_lock = threading.Lock()
+_local      = threading.local()
+_stored:  dict[str, dict[str, str]] | None = None
+_pending: dict[str, dict[str, dict[str, str]]] = {}
+
+
+def _load_validators() -> dict[str, dict[str, str]]:
+    global _stored
+    with _state_lock:
+        if _stored is None:
+            try:
+                _stored = json.loads(VALIDATORS_PATH.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                _stored = {}
+        return _stored
+
+
+def _write_json(path: Path, obj: object) -> None:
+    """Write JSON atomically so concurrent runs never see a half-written file."""
+    with atomicfile.replacing(path) as f:
+        json.dump(obj, f, indent=1, sort_keys=True)
+
+
+def _redact(url: str) -> str:
+    """`url` without credential query parameters."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if k.lower() not in _SECRET_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _conditional_headers(url: str) -> dict[str, str]:
+    if getattr(_local, "owner", None) is None:
+        return {}
+    v = _load_validators().get(_redact(url), {})
+    headers = {}
+    if "etag" in v:
+        headers["If-None-Match"] = v["etag"]
+    if "last_modified" in v:
+        headers["If-Modified-Since"] = v["last_modified"]
+    return headers
+
+
+def _record(url: str, headers: http.client.HTTPMessage) -> None:
+    owner = getattr(_local, "owner", None)
+    if owner is None:
+        return
+    v = {}
+    if headers.get("ETag"):
+        v["etag"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        v["last_modified"] = headers["Last-Modified"]
+    if v:
+        with _state_lock:
+            _pending.setdefault(owner, {})[_redact(url)] = v
+
+
+@contextmanager
+def tracking(owner: str, ttl: float | None = None) -> Iterator[None]:
+    """
+    Fetches made by `owner` in this thread use and record conditional-GET
+    validators, and are served from / stored in the response cache for `ttl`
+    seconds (no caching when ttl is None).
+    """
+    _local.owner = owner
+    _local.ttl = ttl
+    try:
+        yield
+    finally:
+        _local.owner = None
+        _local.ttl = None
+
+
+def commit(owner: str) -> None:
+    """Persist the validators recorded for `owner` so the next run can send them."""
+    stored = _load_validators()
+    with _state_lock:
+        pending = _pending.pop(owner, None)
+        if not pending:
+            return
+        stored.update(pending)
+        _write_json(VALIDATORS_PATH, stored)
+
+
+def discard(owner: str) -> None:
+    """Drop the validators recorded for `owner`; the next run refetches in full."""
+    with _state_lock:
+        _pending.pop(owner, None)
+
+
+# ── fetch ─────────────────────────────────────────────────────────────────────
+
+def set_cache_mode(mode: str) -> None:
+    """One of CACHE_ON, CACHE_OFF or CACHE_ONLY; applies to every thread."""
+    global _cache_mode
+    if mode not in (CACHE_ON, CACHE_OFF, CACHE_ONLY):
+        raise ValueError(f"unknown cache mode: {mode}")
+    _cache_mode = mode
+
+
+def fetch(
+    url: str,
+    headers: dict[str, str] | None = None,
+    *,
+    data: bytes | None = None,
+    timeout: float = 15,
+    verify: bool = True,
+) -> bytes:
+    """
+    GET `url` (or POST `data` to it) and return the decompressed response body.
+
+    Raises NotModified on a 304, urllib.error.HTTPError for 4xx/5xx replies and
+    urllib.error.URLError for connection failures — the same errors collectors
+    saw from urllib.request.urlopen.
+    """
+    method = "GET" if data is None else "POST"
+    request_headers = {"Accept-Encoding": "gzip, deflate", **(headers or {})}
+
+    ttl = getattr(_local, "ttl", None)
+    use_cache = ttl is not None and _cache_mode != CACHE_OFF
+    if use_cache:
+        cache_key = cache.key(method, url, request_headers, data)
+        body = cache.get(cache_key, None if _cache_mode == CACHE_ONLY else ttl)
+        if body is not None:
+            return body
+        if _cache_mode == CACHE_ONLY:
+            raise urllib.error.URLError(f"not in cache: {url}")
+
+    if method == "GET":
+        request_headers.update(_conditional_headers(url))
+
+    location = url
+    for _ in range(MAX_REDIRECTS + 1):
+        status, reason, resp_headers, payload = _request(
+            method, location, request_headers, data, timeout, verify,
+        )
+        if status not in _REDIRECTS or not resp_headers.get("Location"):
+            break
+        location = urljoin(location, resp_headers["Location"])
+        if status == 303 or (status in (301, 302) and method == "POST"):
+            method, data = "GET", None
+    else:
+        raise urllib.error.URLError(f"too many redirects fetching {url}")
+
+    if status == 304:
+        raise NotModified(url)
+    if status >= 400:
+        raise urllib.error.HTTPError(location, status, reason, resp_headers, None)
+
+    if method == "GET":
+        _record(url, resp_headers)
+    body = _decode(payload, resp_headers.get("Content-Encoding"))
+    if use_cache:
+        cache.put(cache_key, _redact(url), body)
+    return body
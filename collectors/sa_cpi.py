@@ -14,14 +14,17 @@ For the precise StatsSA CPI index (December 2016=100), visit:
 and look for the CPI Historical Table Archive. Update data.csv manually if needed.
 
 FRAGILE: Trading Economics may block automated requests.
+
+Run from the repository root with `python -m collectors.sa_cpi`.
 """
 
 import calendar
 import csv
 import re
-import urllib.request
 from pathlib import Path
 
+from collectors.client import fetch
+
 
 _MONTHS = {
     "january": 1, "february": 2, "march": 3, "april": 4,
@@ -47,12 +50,10 @@ def _load_prior_index(month: int, year: int) -> float | None:
 
 def collect() -> list[tuple]:
     url = "https://tradingeconomics.com/south-africa/inflation-cpi"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=15) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=15).decode("utf-8", errors="ignore")
 
     # Pattern: "3.1% in March of 2026" or "edged up to 3.1% in March 2026"
     pattern = r"(\d+\.?\d*)\s*%[^<]{0,30}?in\s+(\w+)[^\d]{0,10}?(?:of\s+)?(\d{4})"
@@ -7,11 +7,14 @@ StatsSA publishes quarterly GDP approximately 3 months after the quarter ends.
 FRAGILE: Trading Economics may block automated requests. If this fails, visit:
   https://www.statssa.gov.za/ → Publications → P0441 Gross Domestic Product
 and add the quarterly growth rate to data.csv manually.
+
+Run from the repository root with `python -m collectors.sa_gdp`.
 """
 
 import calendar
 import re
-import urllib.request
+
+from collectors.client import fetch
 
 
 _QUARTERS = {"Q1": 3, "Q2": 6, "Q3": 9, "Q4": 12}
@@ -23,12 +26,10 @@ def _quarter_end(year: int, month: int) -> str:
 
 def collect() -> list[tuple]:
     url = "https://tradingeconomics.com/south-africa/gdp-growth"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=15) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=15).decode("utf-8", errors="ignore")
 
     # Pattern: "Q4 2025: 0.4% quarter-on-quarter"
     pattern = r"(Q[1-4])\s+(\d{4})[^\d]{0,30}?(-?\d+\.?\d*)\s*%"
@@ -9,11 +9,14 @@ existing data (e.g., a March 26 decision is recorded as 2026-03-31).
 FRAGILE: Trading Economics may block automated requests. If this fails, check:
   https://www.resbank.co.za/en/home/what-we-do/monetary-policy
 and add the decision date and rate to data.csv manually.
+
+Run from the repository root with `python -m collectors.sa_repo_rate`.
 """
 
 import calendar
 import re
-import urllib.request
+
+from collectors.client import fetch
 
 
 _MONTHS = {
@@ -29,12 +32,10 @@ def _month_end(year: int, month: int) -> str:
 
 def collect() -> list[tuple]:
     url = "https://tradingeconomics.com/south-africa/interest-rate"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=15) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=15).decode("utf-8", errors="ignore")
 
     # Pattern: "November 20, 2025 | 6.75% | Cut of 25 basis points"
     # or "January 29, 2026 | 6.75% | Held unchanged"
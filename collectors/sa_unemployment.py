@@ -8,11 +8,14 @@ StatsSA publishes the Quarterly Labour Force Survey (QLFS) approximately
 FRAGILE: Trading Economics may block automated requests. If this fails, visit:
   https://www.statssa.gov.za/ → Publications → P0211 Quarterly Labour Force Survey
 and add the quarterly rate to data.csv manually.
+
+Run from the repository root with `python -m collectors.sa_unemployment`.
 """
 
 import calendar
 import re
-import urllib.request
+
+from collectors.client import fetch
 
 
 _QUARTERS = {"Q1": 3, "Q2": 6, "Q3": 9, "Q4": 12}
@@ -24,12 +27,10 @@ def _quarter_end(year: int, month: int) -> str:
 
 def collect() -> list[tuple]:
     url = "https://tradingeconomics.com/south-africa/unemployment-rate"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=15) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=15).decode("utf-8", errors="ignore")
 
     # Pattern: "Q4 2025: 31.4%" or "31.4% in Q4 2025"
     pattern = r"(Q[1-4])\s+(\d{4})[^\d]{0,20}?(\d+\.?\d*)\s*%"
@@ -2,27 +2,31 @@
 
 Takes end-of-quarter monthly values and computes year-over-year percentage change.
 Returns (date, yoy_pct, index_value) tuples for Q1-Q4 of recent years.
+
+Run from the repository root with `python -m collectors.us_cpi`.
 """
 
 import calendar
-import json
-import urllib.request
 from collections import defaultdict
+from datetime import date
+
+from collectors import bls
+
+BLS_SERIES = ("CUSR0000SA0",)
 
 
 def _month_end(year: int, month: int) -> str:
     return f"{year}-{month:02d}-{calendar.monthrange(year, month)[1]:02d}"
 
 
-def collect() -> list[tuple]:
-    url = "https://api.bls.gov/publicAPI/v1/timeseries/data/CUSR0000SA0"
-    req = urllib.request.Request(url, headers={"User-Agent": "political-data-collector/1.0"})
-    with urllib.request.urlopen(req, timeout=15) as r:
-        data = json.loads(r.read())
+def collect(since: date | None = None) -> list[tuple]:
+    # With `since`, request only the years from the last update onwards, plus
+    # the year before so the first new quarter still has a year-ago value.
+    startyear = since.year - 1 if since else None
 
     # Build month -> index map
     by_month: dict[tuple[int, int], float] = {}
-    for item in data["Results"]["series"][0]["data"]:
+    for item in bls.series(BLS_SERIES[0], startyear):
         p = item["period"]
         if not p.startswith("M") or p == "M13":
             continue
@@ -39,7 +43,7 @@ def collect() -> list[tuple]:
         yoy = round((index - prior) / prior * 100, 2)
         rows.append((_month_end(year, month), str(yoy), str(round(index, 1))))
 
-    return rows[-8:]
+    return rows if since else rows[-8:]
 
 
 if __name__ == "__main__":
@@ -7,13 +7,16 @@ The FEDFUNDS series (FRED) is a monthly average. This collector reads the curren
 effective rate from the H.15 page and assigns it to the current month. It is
 accurate for months where the rate did not change; for months spanning an FOMC
 decision, the value may differ slightly from the true monthly average.
+
+Run from the repository root with `python -m collectors.us_federal_funds`.
 """
 
 import calendar
 import re
-import urllib.request
 from datetime import date
 
+from collectors.client import fetch
+
 
 def _month_end(year: int, month: int) -> str:
     return f"{year}-{month:02d}-{calendar.monthrange(year, month)[1]:02d}"
@@ -21,11 +24,9 @@ def _month_end(year: int, month: int) -> str:
 
 def collect() -> list[tuple]:
     url = "https://www.federalreserve.gov/releases/h15/"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-    })
-    with urllib.request.urlopen(req, timeout=15) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=15).decode("utf-8", errors="ignore")
 
     # Find the effective federal funds rate
     m = re.search(r"effective federal funds rate[^<]*?(\d+\.\d+)%", html, re.IGNORECASE)
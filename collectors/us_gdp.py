@@ -12,11 +12,14 @@ The BEA publishes three estimates per quarter:
   • Second estimate (month 2)
   • Third/final (month 3)
 Use the most recently published estimate.
+
+Run from the repository root with `python -m collectors.us_gdp`.
 """
 
 import calendar
 import re
-import urllib.request
+
+from collectors.client import fetch
 
 
 _QUARTERS = {"Q1": 3, "Q2": 6, "Q3": 9, "Q4": 12}
@@ -28,12 +31,10 @@ def _quarter_end(year: int, quarter_month: int) -> str:
 
 def collect() -> list[tuple]:
     url = "https://tradingeconomics.com/united-states/gdp-growth"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=15) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=15).decode("utf-8", errors="ignore")
 
     # Pattern: "Q4 2025: 0.5% quarter-on-quarter" or "Q1 2026 at 0.5%"
     pattern = r"(Q[1-4])\s+(\d{4})[^\d]{0,30}?(-?\d+\.?\d*)\s*%"
@@ -2,13 +2,16 @@
 
 Source: https://www.freddiemac.com/pmms/archive
 Computes monthly average from weekly survey readings.
+
+Run from the repository root with `python -m collectors.us_mortgage`.
 """
 
 import calendar
 import re
-import urllib.request
 from collections import defaultdict
 
+from collectors.client import fetch
+
 
 def _month_end(year: int, month: int) -> str:
     return f"{year}-{month:02d}-{calendar.monthrange(year, month)[1]:02d}"
@@ -16,12 +19,10 @@ def _month_end(year: int, month: int) -> str:
 
 def collect() -> list[tuple]:
     url = "https://www.freddiemac.com/pmms/archive"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=15) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=15).decode("utf-8", errors="ignore")
 
     # Weekly data rows: date like "01/02/2026" and rate like "6.91"
     pattern = r"(\d{2})/(\d{2})/(\d{4})[^<]*?(\d+\.\d+)%"
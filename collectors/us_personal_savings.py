@@ -5,11 +5,14 @@ Returns the most recent 1-2 months of personal saving rate as % of disposable in
 
 FRAGILE: Trading Economics may block automated requests. If this collector fails,
 visit https://fred.stlouisfed.org/series/PSAVERT for the latest value.
+
+Run from the repository root with `python -m collectors.us_personal_savings`.
 """
 
 import calendar
 import re
-import urllib.request
+
+from collectors.client import fetch
 
 
 _MONTHS = {
@@ -25,12 +28,10 @@ def _month_end(year: int, month: int) -> str:
 
 def collect() -> list[tuple]:
     url = "https://tradingeconomics.com/united-states/personal-savings"
-    req = urllib.request.Request(url, headers={
+    html = fetch(url, headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "text/html,application/xhtml+xml",
-    })
-    with urllib.request.urlopen(req, timeout=15) as r:
-        html = r.read().decode("utf-8", errors="ignore")
+    }, timeout=15).decode("utf-8", errors="ignore")
 
     # Look for patterns like "decreased to 4 percent in February from 4.50 percent in January of 2026"
     pattern = r"(\d+(?:\.\d+)?)\s*percent\s+in\s+(\w+)\s+(?:from\s+\S+\s+in\s+\S+\s+)?of\s+(\d{4})"
@@ -7,12 +7,16 @@ Without a FRED key this collector cannot run. The series is not available via th
 BLS public API. Manually look up the value at:
   https://fred.stlouisfed.org/series/LES1252881600Q
 and append a row to data.csv in the format: YYYY-MM-DD,value
+
+Run from the repository root with `python -m collectors.us_real_earnings`.
 """
 
 import calendar
 import json
 import os
-import urllib.request
+from datetime import date
+
+from collectors.client import fetch
 
 
 def _quarter_end(year: int, quarter: int) -> str:
@@ -20,21 +24,24 @@ def _quarter_end(year: int, quarter: int) -> str:
     return f"{year}-{month:02d}-{calendar.monthrange(year, month)[1]:02d}"
 
 
-def collect() -> list[tuple]:
+def collect(since: date | None = None) -> list[tuple]:
     api_key = os.environ.get("FRED_API_KEY")
     if not api_key:
         raise RuntimeError(
             "FRED_API_KEY not set. Get a free key at https://fred.stlouisfed.org/docs/api/api_key.html "
             "or update manually from https://fred.stlouisfed.org/series/LES1252881600Q"
         )
+    if since:
+        # Only observations from the quarter of the last update onwards.
+        window = f"&observation_start={since.year}-{(since.month - 1) // 3 * 3 + 1:02d}-01"
+    else:
+        window = "&sort_order=desc&limit=8"
     url = (
         f"https://api.stlouisfed.org/fred/series/observations"
         f"?series_id=LES1252881600Q&api_key={api_key}&file_type=json"
-        f"&sort_order=desc&limit=8"
+        f"{window}"
     )
-    req = urllib.request.Request(url, headers={"User-Agent": "political-data-collector/1.0"})
-    with urllib.request.urlopen(req, timeout=15) as r:
-        data = json.loads(r.read())
+    data = json.loads(fetch(url, headers={"User-Agent": "political-data-collector/1.0"}, timeout=15))
     rows = []
     for obs in data.get("observations", []):
         if obs["value"] == ".":
@@ -44,7 +51,7 @@ def collect() -> list[tuple]:
         quarter = (month - 1) // 3 + 1
         rows.append((_quarter_end(year, quarter), obs["value"]))
     rows.sort()
-    return rows[-6:]
+    return rows if since else rows[-6:]
 
 
 if __name__ == "__main__":
@@ -1,27 +1,31 @@
-"""US Rent Prices — BLS API series CUSR0000SEHA (Rent of Primary Residence CPI, 1982-84=100)."""
+"""US Rent Prices — BLS API series CUSR0000SEHA (Rent of Primary Residence CPI, 1982-84=100).
+
+Run from the repository root with `python -m collectors.us_rent`.
+"""
 
 import calendar
-import json
-import urllib.request
+from datetime import date
+
+from collectors import bls
+
+BLS_SERIES = ("CUSR0000SEHA",)
 
 
 def _month_end(year: int, month: int) -> str:
     return f"{year}-{month:02d}-{calendar.monthrange(year, month)[1]:02d}"
 
 
-def collect() -> list[tuple]:
-    url = "https://api.bls.gov/publicAPI/v1/timeseries/data/CUSR0000SEHA"
-    req = urllib.request.Request(url, headers={"User-Agent": "political-data-collector/1.0"})
-    with urllib.request.urlopen(req, timeout=15) as r:
-        data = json.loads(r.read())
+def collect(since: date | None = None) -> list[tuple]:
+    # With `since`, request only the years from the last update onwards.
+    startyear = since.year if since else None
     rows = []
-    for item in data["Results"]["series"][0]["data"]:
+    for item in bls.series(BLS_SERIES[0], startyear):
         p = item["period"]
         if not p.startswith("M") or p == "M13":
             continue
         rows.append((_month_end(int(item["year"]), int(p[1:])), item["value"]))
     rows.sort()
-    return rows[-12:]
+    return rows if since else rows[-12:]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,184 @@
+"""
+datacache.py — binary sidecar cache of parsed indicator files.
+
+Parsing an indicator YAML (yaml.safe_load, key normalisation and Series
+construction) dominates a cold build. `load(path, parse)` keeps the parsed form
+of each file under CACHE_DIR and, on a warm start, reads it back in one
+piece instead of parsing:
+
+    magic (8 bytes) | header length (u64) | header | padding | arrays...
+
+The header is a pickle of the file stamp (path, mtime_ns, size, sha256), the
+indicator document with each charted graph's Series replaced by a placeholder,
+and the offsets of each Series' arrays. The arrays follow, each 8-byte aligned:
+int32 day ordinals, float64 values and uint8 integer flags. Loaded Series are
+zero-copy views over the entry's bytes and copy themselves into ordinary arrays
+only if modified (e.g. by a merge). The entry is read rather than memory-mapped:
+a mapping keeps a file descriptor open for as long as any Series over it
+lives, and a build holding every indicator would run out of descriptors.
+
+An entry is reused when mtime and size match, or when they differ but the
+content hash still matches (a fresh checkout touches every mtime). Anything
+else — a changed file, or an unreadable or truncated cache entry — is rebuilt
+from the YAML on the fly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import struct
+from array import array
+from pathlib import Path
+from typing import Any, Callable
+
+import atomicfile
+from series import Series
+
+CACHE_DIR = Path(".cache") / "indicators"
+
+_MAGIC  = b"PDIDX\x00\x01\x00"
+_LENGTH = struct.Struct("<Q")
+_ALIGN  = 8
+
+# The layout assumes 4-byte C ints; anywhere else, always parse.
+ENABLED = array("i").itemsize == 4
+
+
+class _Placeholder:
+    """Stands in for the n-th Series inside a pickled header."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    def __reduce__(self):
+        return (_Placeholder, (self.index,))
+
+
+def _cache_path(path: Path) -> Path:
+    key = hashlib.sha1(str(path.resolve()).encode()).hexdigest()
+    return CACHE_DIR / f"{key}.bin"
+
+
+def _pad(n: int) -> int:
+    return -n % _ALIGN
+
+
+def _map_graphs(doc: dict, fn: Callable[[dict], dict]) -> dict:
+    graphs = doc.get("graph")
+    if not isinstance(graphs, list):
+        return dict(doc)
+    return {**doc, "graph": [fn(g) if isinstance(g, dict) else g for g in graphs]}
+
+
+# ── write ─────────────────────────────────────────────────────────────────────
+
+def _write(cache_path: Path, stamp: dict[str, Any], doc: dict) -> None:
+    series: list[Series] = []
+
+    def strip(g: dict) -> dict:
+        if not isinstance(g.get("data"), Series):
+            return g
+        series.append(g["data"])
+        return {**g, "data": _Placeholder(len(series) - 1)}
+
+    header_doc = _map_graphs(doc, strip)
+
+    layout: list[tuple[int, int, int, int]] = []
+    chunks: list[bytes] = []
+    offset = 0
+    for s in series:
+        offsets = []
+        for buf in (s.ordinals, s.floats, s.flags):
+            raw = memoryview(buf).cast("B").tobytes()
+            offsets.append(offset)
+            chunks.append(raw + b"\0" * _pad(len(raw)))
+            offset += len(raw) + _pad(len(raw))
+        layout.append((len(s), *offsets))
+
+    header = pickle.dumps(
+        {"stamp": stamp, "doc": header_doc, "layout": layout},
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    head = _MAGIC + _LENGTH.pack(len(header)) + header
+    head += b"\0" * _pad(len(head))
+
+    try:
+        with atomicfile.replacing(cache_path, binary=True) as f:
+            f.write(head)
+            f.writelines(chunks)
+    except OSError:
+        # The cache is only an optimisation; keep the old entry.
+        pass
+
+
+# ── read ──────────────────────────────────────────────────────────────────────
+
+def _read(cache_path: Path) -> tuple[dict, Callable[[], dict]] | None:
+    """(header, attach) for a cache entry, or None. attach() builds the document."""
+    try:
+        buf = cache_path.read_bytes()
+        if buf[:len(_MAGIC)] != _MAGIC:
+            return None
+        start = len(_MAGIC) + _LENGTH.size
+        (n,) = _LENGTH.unpack_from(buf, len(_MAGIC))
+        header = pickle.loads(buf[start:start + n])
+    except (OSError, ValueError, EOFError, struct.error, pickle.UnpicklingError):
+        return None
+    base = start + n + _pad(start + n)
+
+    def attach() -> dict:
+        view = memoryview(buf)
+        series = []
+        for count, o_off, v_off, f_off in header["layout"]:
+            o, v, fl = base + o_off, base + v_off, base + f_off
+            series.append(Series.from_buffers(
+                view[o:o + 4 * count].cast("i"),
+                view[v:v + 8 * count].cast("d"),
+                view[fl:fl + count],
+            ))
+
+        def restore(g: dict) -> dict:
+            if isinstance(g.get("data"), _Placeholder):
+                return {**g, "data": series[g["data"].index]}
+            return g
+
+        return _map_graphs(header["doc"], restore)
+
+    return header, attach
+
+
+def load(path: Path, parse: Callable[[str], dict]) -> dict:
+    """
+    The parsed indicator document for `path`, from the cache when it is still
+    valid, otherwise via `parse(text)` (which then refreshes the cache).
+    """
+    if not ENABLED:
+        return parse(path.read_text(encoding="utf-8"))
+
+    cache_path = _cache_path(path)
+    st = path.stat()
+    stamp = {"path": str(path.resolve()), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+    cached = _read(cache_path)
+    content = None
+    if cached is not None:
+        header, attach = cached
+        old = header["stamp"]
+        if all(old.get(k) == stamp[k] for k in ("path", "mtime_ns", "size")):
+            return attach()
+        if old.get("size") == stamp["size"]:
+            content = path.read_bytes()
+            sha = hashlib.sha256(content).hexdigest()
+            if old.get("sha256") == sha:
+                doc = attach()
+                _write(cache_path, {**stamp, "sha256": sha}, doc)
+                return doc
+
+    if content is None:
+        content = path.read_bytes()
+    doc = parse(content.decode("utf-8"))
+    _write(cache_path, {**stamp, "sha256": hashlib.sha256(content).hexdigest()}, doc)
+    return doc
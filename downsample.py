@@ -0,0 +1,72 @@
+"""
+downsample.py — reduce a time series to a target number of points for charting.
+
+`lttb()` implements Largest-Triangle-Three-Buckets (Steinarsson, 2013): the
+first and last points are kept, the rest are split into target - 2 equal
+buckets, and from each bucket the point forming the largest triangle with the
+previously kept point and the average of the next bucket is chosen. Peaks,
+troughs and turning points survive, which plain every-n-th sampling loses.
+
+`pyramid()` builds successively finer LTTB levels (target, target × factor, …)
+ending with the full series, for charts that switch resolution as the user
+zooms in.
+
+Both work on parallel x / y sequences (x ascending, e.g. day ordinals) and
+return indices into them, so callers keep their own value types.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+PYRAMID_FACTOR = 4
+
+
+def lttb(xs: Sequence[float], ys: Sequence[float], target: int) -> list[int]:
+    """Indices of at most `target` points of (xs, ys) chosen by LTTB (all if target < 3)."""
+    n = len(xs)
+    if target >= n or target < 3:
+        return list(range(n))
+
+    every = (n - 2) / (target - 2)
+    keep = [0]
+    a = 0
+    for i in range(target - 2):
+        # Average of the next bucket (the last point for the final bucket)
+        nxt_lo = int((i + 1) * every) + 1
+        nxt_hi = min(int((i + 2) * every) + 1, n)
+        if nxt_lo >= nxt_hi:
+            nxt_lo, nxt_hi = n - 1, n
+        span = nxt_hi - nxt_lo
+        avg_x = sum(xs[nxt_lo:nxt_hi]) / span
+        avg_y = sum(ys[nxt_lo:nxt_hi]) / span
+
+        # Point in this bucket with the largest triangle area
+        lo = int(i * every) + 1
+        hi = int((i + 1) * every) + 1
+        ax, ay = xs[a], ys[a]
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        keep.append(best)
+        a = best
+
+    keep.append(n - 1)
+    return keep
+
+
+def pyramid(xs: Sequence[float], ys: Sequence[float], target: int, levels: int) -> list[list[int]]:
+    """
+    Up to `levels` index lists, coarsest first: LTTB at target, target ×
+    PYRAMID_FACTOR, … and finally every point. Stops early once a level would
+    hold the whole series.
+    """
+    result: list[list[int]] = []
+    size = target
+    while len(result) < levels - 1 and size < len(xs):
+        result.append(lttb(xs, ys, size))
+        size *= PYRAMID_FACTOR
+    result.append(list(range(len(xs))))
+    return result
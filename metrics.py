@@ -0,0 +1,167 @@
+"""
+metrics.py — batched RAG, delta and sparkline computations for build.py.
+
+Every charted series is summarised the same way: period-over-period deltas
+and their RAG codes (for the data table), a lookback comparison of the latest
+value (the RAG dot on jurisdiction pages) and normalised sparkline
+coordinates. `summarise()` does all of it for one Series from a single view of
+its float64 values (NaN = missing), and `period_codes()` handles the
+date-aligned columns of multi-series tables.
+
+The RAG dot and the sparkline need only the series' last SPARKLINE_POINTS
+present values, its tail: `tail()` extracts it (the data catalog stores it)
+and `tail_summary()` draws both from it, so jurisdiction pages are built
+without the series itself.
+
+NumPy is used when it is installed (the Series buffer is wrapped without
+copying); otherwise the same arithmetic runs in pure Python. Both paths give
+identical results, down to the formatted sparkline coordinates.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+from series import Series
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+LOOKBACK = 12          # points back for the latest-value RAG
+SPARKLINE_POINTS = 240 # most recent present values a sparkline is drawn from
+EPSILON  = 1e-9        # smaller changes count as "no change"
+
+_SIGN = {"lower_is_better": -1.0, "higher_is_better": 1.0}
+
+
+# ── period-over-period ────────────────────────────────────────────────────────
+
+def _codes_numpy(values, sign: float) -> str:
+    v = np.asarray(values, dtype=np.float64)
+    change = np.full(len(v), np.nan)
+    change[1:] = (v[1:] - v[:-1]) * sign
+    out = np.full(len(v), ord("-"), dtype=np.uint8)
+    out[change > EPSILON] = ord("g")
+    out[change < -EPSILON] = ord("b")
+    return out.tobytes().decode("ascii")
+
+
+def _codes_python(values: Sequence[float], sign: float) -> str:
+    codes = ["-"]
+    for p, v in zip(values, values[1:]):
+        change = (v - p) * sign
+        codes.append("g" if change > EPSILON else "b" if change < -EPSILON else "-")
+    return "".join(codes)
+
+
+def period_codes(values: Sequence[float | None], direction: str) -> str:
+    """
+    One character per value: 'g' / 'b' when it improved / worsened on the
+    previous value given the direction, '-' otherwise (no direction, a
+    missing value on either side, or no change). None and NaN are missing.
+    """
+    sign = _SIGN.get(direction)
+    if sign is None or not values:
+        return "-" * len(values)
+    floats = [math.nan if v is None else float(v) for v in values]
+    return _codes_numpy(floats, sign) if np is not None else _codes_python(floats, sign)
+
+
+# ── one series ────────────────────────────────────────────────────────────────
+
+def _lookback_rag(values: Sequence[float], direction: str, lookback: int) -> str:
+    """'good', 'bad', or '' comparing the latest value to `lookback` points earlier."""
+    sign = _SIGN.get(direction)
+    if sign is None or len(values) < 2:
+        return ""
+    back = min(lookback, len(values) - 1)
+    change = (values[-1] - values[-back - 1]) * sign
+    if abs(change) < EPSILON:
+        return ""
+    return "good" if change > 0 else "bad"
+
+
+def _sparkline_points(values, width: int, height: int, pad: int) -> str:
+    n = len(values) - 1
+    if np is not None:
+        v = np.asarray(values, dtype=np.float64)
+        mn, mx = float(v.min()), float(v.max())
+    else:
+        mn, mx = min(values), max(values)
+    if mx == mn:
+        mid = height / 2
+        return f"0,{mid:.0f} {width},{mid:.0f}"
+    if np is not None:
+        xs = (np.arange(len(v)) / n * width).tolist()
+        ys = (pad + (1 - (v - mn) / (mx - mn)) * (height - 2 * pad)).tolist()
+    else:
+        xs = [i / n * width for i in range(len(values))]
+        ys = [pad + (1 - (v - mn) / (mx - mn)) * (height - 2 * pad) for v in values]
+    return " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+
+
+def sparkline_svg(points: str, width: int = 140, height: int = 36) -> str:
+    if not points:
+        return ""
+    return (
+        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+        f'<polyline points="{points}" fill="none" stroke="#3498db" stroke-width="1.5" '
+        f'stroke-linejoin="round" stroke-linecap="round"/></svg>'
+    )
+
+
+def tail(data: Series) -> list[float]:
+    """The last SPARKLINE_POINTS present values of `data`, in date order."""
+    return data.numeric()[-SPARKLINE_POINTS:]
+
+
+def tail_summary(
+    values: Sequence[float],
+    direction: str,
+    lookback: int = LOOKBACK,
+    width: int = 140,
+    height: int = 36,
+    pad: int = 2,
+) -> dict:
+    """{"rag", "sparkline"} from a series' tail (see `tail()`)."""
+    return {
+        "rag":       _lookback_rag(values, direction, lookback),
+        "sparkline": sparkline_svg(
+            _sparkline_points(values, width, height, pad) if len(values) >= 2 else "",
+            width, height,
+        ),
+    }
+
+
+def summarise(
+    data: Series,
+    direction: str,
+    lookback: int = LOOKBACK,
+    width: int = 140,
+    height: int = 36,
+    pad: int = 2,
+) -> dict:
+    """
+    {"codes", "rag", "sparkline"} for one series, from one pass over its values:
+
+        codes      period_codes() over every point, in date order
+        rag        lookback comparison of the latest present value
+        sparkline  SVG polyline of the tail ("" if fewer than two values)
+    """
+    sign = _SIGN.get(direction)
+    if np is not None:
+        v = np.frombuffer(data.floats, dtype=np.float64) if len(data) else np.empty(0)
+        present = v[~np.isnan(v)]
+        codes = _codes_numpy(v, sign) if sign is not None and len(v) else "-" * len(v)
+    else:
+        v = data.floats
+        present = [x for x in v if x == x]
+        codes = _codes_python(v, sign) if sign is not None and len(v) else "-" * len(v)
+
+    return {
+        "codes": codes,
+        **tail_summary(present[-SPARKLINE_POINTS:], direction, lookback, width, height, pad),
+    }
@@ -0,0 +1,130 @@
+"""
+minify.py — streaming whitespace minifier for the pages build.py renders.
+
+`Minifier` is fed the chunks of `Template.generate()` as they are produced and
+returns minified text as soon as it is safe to, holding back only a partial
+tag or a trailing run of whitespace between chunks.
+
+It only removes whitespace, so it never changes what a page means:
+
+    markup             runs of whitespace become one newline (if the run held
+                       one) or one space; HTML keeps whitespace significant
+                       between inline elements, so none is removed outright
+    <script>, <style>  each line loses its indentation and trailing blanks and
+                       blank lines are dropped; line breaks stay, so automatic
+                       semicolon insertion and CSS selectors are unaffected,
+                       and lines inside a multi-line JS template literal are
+                       left as they are
+    <pre>, <textarea>  passed through untouched
+"""
+
+from __future__ import annotations
+
+import re
+
+_RAW_OPEN = re.compile(r"<(script|style|pre|textarea)\b[^>]*>", re.IGNORECASE)
+# ASCII whitespace only: str methods and \s also match U+00A0, U+2028 and the
+# like, which are content, not formatting.
+_WS       = " \t\n\r\f\v"
+_SPACE    = re.compile(r"[ \t\n\r\f\v]+")
+_LINE     = re.compile(r"[^\n]*\n|[^\n]+")
+_VERBATIM = ("pre", "textarea")
+
+
+def _collapse(match: re.Match) -> str:
+    return "\n" if "\n" in match.group() else " "
+
+
+class Minifier:
+    """Incremental minifier: feed() chunks in order, then close() once."""
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._raw: str | None = None    # name of the raw element we are inside
+        self._in_template = False       # inside a multi-line `template literal`
+
+    def feed(self, chunk: str) -> str:
+        self._buf += chunk
+        out = []
+        while self._buf:
+            if self._raw is None:
+                done = self._markup(out)
+            else:
+                done = self._raw_text(out)
+            if not done:
+                break
+        return "".join(out)
+
+    def close(self) -> str:
+        """Flush whatever is still held back."""
+        if self._raw is None:
+            tail = _SPACE.sub(_collapse, self._buf)
+        else:
+            tail = self._raw_lines(self._buf)
+        self._buf = ""
+        return tail
+
+    # Each step consumes a prefix of the buffer; False means it needs more input.
+
+    def _markup(self, out: list[str]) -> bool:
+        buf = self._buf
+        m = _RAW_OPEN.search(buf)
+        if m:
+            out.append(_SPACE.sub(_collapse, buf[:m.start()]) + m.group())
+            self._buf = buf[m.end():]
+            self._raw = m.group(1).lower()
+            return True
+        # Keep back a tag that may still turn out to open a raw element, and
+        # trailing whitespace that the next chunk may extend.
+        cut = len(buf)
+        lt = buf.rfind("<")
+        if lt != -1 and buf.find(">", lt) == -1:
+            cut = lt
+        cut = len(buf[:cut].rstrip(_WS))
+        out.append(_SPACE.sub(_collapse, buf[:cut]))
+        self._buf = buf[cut:]
+        return False
+
+    def _raw_text(self, out: list[str]) -> bool:
+        buf = self._buf
+        end = buf.lower().find("</" + self._raw)
+        if end != -1:
+            body, self._buf = buf[:end], buf[end:]
+            out.append(body if self._raw in _VERBATIM else self._raw_lines(body))
+            self._raw = None
+            self._in_template = False
+            return True
+        if self._raw in _VERBATIM:
+            # A closing tag never spans a newline, so everything before the
+            # last one is safe to pass on.
+            nl = buf.rfind("\n") + 1
+            out.append(buf[:nl])
+        else:
+            nl = buf.rfind("\n") + 1
+            out.append(self._raw_lines(buf[:nl]))
+        self._buf = buf[nl:]
+        return False
+
+    def _raw_lines(self, text: str) -> str:
+        if self._raw in _VERBATIM:
+            return text
+        lines = []
+        for line in _LINE.findall(text):
+            if self._in_template:
+                lines.append(line)
+            elif line.strip(_WS):
+                lines.append(line.strip(_WS) + ("\n" if line.endswith("\n") else ""))
+            if self._raw == "script" and line.count("`") % 2:
+                self._in_template = not self._in_template
+        return "".join(lines)
+
+
+def minify(chunks) -> tuple[str, int]:
+    """Minify an iterable of text chunks; returns (minified text, input length in bytes)."""
+    m = Minifier()
+    out, size = [], 0
+    for chunk in chunks:
+        size += len(chunk.encode("utf-8"))
+        out.append(m.feed(chunk))
+    out.append(m.close())
+    return "".join(out), size
@@ -0,0 +1,190 @@
+"""
+series.py — compact time-series storage for charted graph data.
+
+A Series holds one graph's `data:` block as two parallel, contiguous arrays:
+dates as sorted integer day ordinals (`date.toordinal()`, int32) and values as
+float64. It behaves as a read-only mapping of ISO date string -> value, so code
+that iterates `graph["data"].items()` keeps working, and adds O(log n) range
+slicing, latest-value access and membership checks on top.
+
+Indicator converts each charted graph's dict to a Series on load and back to a
+dict on save; nothing else should need the dict form.
+
+The arrays may also be read-only buffers (memoryviews over a cache entry read
+by datacache.py); such a Series copies them into its own arrays
+the first time it is modified.
+
+Missing or non-numeric values are stored as NaN and come back as None. Values
+that were YAML integers come back as int, so saving a loaded file does not
+turn `685000` into `685000.0`.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from datetime import date
+from typing import Any, Iterator
+
+Value = int | float | None
+
+
+def to_ordinal(iso: str) -> int:
+    return date.fromisoformat(iso).toordinal()
+
+
+def to_iso(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
+
+
+def _encode(v: Any) -> tuple[float, int]:
+    """(float64 value, integer flag) for a YAML scalar; NaN for anything non-numeric."""
+    if isinstance(v, bool) or not isinstance(v, (int, float)):
+        return math.nan, 0
+    return float(v), int(isinstance(v, int))
+
+
+class Series(Mapping):
+    __slots__ = ("_ords", "_vals", "_ints")
+
+    def __init__(self) -> None:
+        self._ords = array("i")
+        self._vals = array("d")
+        self._ints = bytearray()   # 1 where the value was an integer in the source
+
+    # ── conversion ────────────────────────────────────────────────────────────
+
+    @classmethod
+    def from_dict(cls, data: Mapping[Any, Any] | None) -> Series:
+        s = cls()
+        points = sorted(
+            ((k if isinstance(k, date) else date.fromisoformat(str(k))).toordinal(), v)
+            for k, v in (data or {}).items()
+        )
+        for o, v in points:
+            fv, fi = _encode(v)
+            s._ords.append(o)
+            s._vals.append(fv)
+            s._ints.append(fi)
+        return s
+
+    @classmethod
+    def _from_arrays(cls, ords: array, vals: array, ints: bytearray) -> Series:
+        s = cls()
+        s._ords, s._vals, s._ints = ords, vals, ints
+        return s
+
+    @classmethod
+    def from_buffers(cls, ords: memoryview, vals: memoryview, ints: memoryview) -> Series:
+        """A Series over existing int32 / float64 / uint8 buffers, without copying."""
+        return cls._from_arrays(ords, vals, ints)
+
+    def _own(self) -> None:
+        """Copy buffer-backed storage into owned, growable arrays."""
+        if isinstance(self._ords, array):
+            return
+        ords, vals = array("i"), array("d")
+        ords.frombytes(memoryview(self._ords).cast("B"))
+        vals.frombytes(memoryview(self._vals).cast("B"))
+        self._ords, self._vals, self._ints = ords, vals, bytearray(self._ints)
+
+    def to_dict(self) -> dict[str, Value]:
+        return dict(self.items())
+
+    def _value(self, i: int) -> Value:
+        v = self._vals[i]
+        if v != v:                       # NaN: missing
+            return None
+        return int(v) if self._ints[i] else v
+
+    # ── mapping protocol (ISO date string -> value) ──────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._ords)
+
+    def __iter__(self) -> Iterator[str]:
+        return (to_iso(o) for o in self._ords)
+
+    def _find(self, iso: str) -> int:
+        try:
+            o = to_ordinal(iso)
+        except (TypeError, ValueError):
+            return -1
+        i = bisect_left(self._ords, o)
+        return i if i < len(self._ords) and self._ords[i] == o else -1
+
+    def __getitem__(self, iso: str) -> Value:
+        i = self._find(iso)
+        if i < 0:
+            raise KeyError(iso)
+        return self._value(i)
+
+    def __contains__(self, iso: object) -> bool:
+        return isinstance(iso, str) and self._find(iso) >= 0
+
+    def get(self, iso: str, default: Any = None) -> Any:
+        i = self._find(iso)
+        return default if i < 0 else self._value(i)
+
+    def items(self) -> Iterator[tuple[str, Value]]:   # type: ignore[override]
+        return ((to_iso(o), self._value(i)) for i, o in enumerate(self._ords))
+
+    def __repr__(self) -> str:
+        if not self:
+            return "Series([])"
+        return f"Series({len(self)} points, {to_iso(self._ords[0])}..{to_iso(self._ords[-1])})"
+
+    # ── mutation ──────────────────────────────────────────────────────────────
+
+    def set(self, iso: str, value: Any) -> None:
+        """Insert or replace the value at `iso`, keeping dates sorted."""
+        self._own()
+        o = to_ordinal(iso)
+        fv, fi = _encode(value)
+        i = bisect_left(self._ords, o)
+        if i < len(self._ords) and self._ords[i] == o:
+            self._vals[i], self._ints[i] = fv, fi
+        else:
+            self._ords.insert(i, o)
+            self._vals.insert(i, fv)
+            self._ints.insert(i, fi)
+
+    # ── queries ───────────────────────────────────────────────────────────────
+
+    @property
+    def ordinals(self) -> array:
+        """Sorted day ordinals (do not modify)."""
+        return self._ords
+
+    @property
+    def floats(self) -> array:
+        """float64 values parallel to `ordinals`, NaN where missing (do not modify)."""
+        return self._vals
+
+    @property
+    def flags(self) -> bytearray:
+        """1 where the value was a YAML integer, parallel to `ordinals` (do not modify)."""
+        return self._ints
+
+    def slice(self, start: str | None = None, end: str | None = None) -> Series:
+        """Points with start <= date < end (either bound optional)."""
+        lo = 0 if start is None else bisect_left(self._ords, to_ordinal(start))
+        hi = len(self._ords) if end is None else bisect_left(self._ords, to_ordinal(end))
+        return Series._from_arrays(self._ords[lo:hi], self._vals[lo:hi], self._ints[lo:hi])
+
+    def first(self) -> tuple[str, Value] | None:
+        return (to_iso(self._ords[0]), self._value(0)) if self._ords else None
+
+    def latest(self) -> tuple[str, Value] | None:
+        return (to_iso(self._ords[-1]), self._value(-1)) if self._ords else None
+
+    def numeric(self) -> list[float]:
+        """Values in date order, missing points dropped."""
+        return [self._value(i) for i, v in enumerate(self._vals) if v == v]
+
+    def __reduce__(self):
+        self._own()
+        return (Series._from_arrays, (self._ords, self._vals, self._ints))
+
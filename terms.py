@@ -0,0 +1,103 @@
+"""
+terms.py — statistics of a charted series over each government term.
+
+Government terms come from an overlay indicator (e.g. au_prime_minister): each
+entry's date starts a term that runs until the next entry's date, and the last
+term runs to the end of the data. `term_stats()` walks one series across all
+terms at once. The series' missing points are dropped in a single pass and term
+boundaries are then found by binary search, starting each search where the
+previous term ended, so the cost is O(points + terms × log points) however many
+governments and data points there are.
+
+For every term it returns:
+
+    start, end   value at the start of the term (first point on or after the
+                 term's first day) and at the end (last point before the next
+                 term begins, or the latest point for the current term)
+    delta        end - start
+    rag          "good" / "bad" / "neutral" for delta given the graph's direction
+    points       number of data points dated inside the term
+    mean, min, max, annualised
+                 over the points inside the term (None when there are none);
+                 annualised is the change between the first and last of those
+                 points divided by the years between them
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+from series import Series, Value, to_ordinal
+
+DAYS_PER_YEAR = 365.25
+
+
+def _rag(delta: float, direction: str) -> str:
+    if abs(delta) < 1e-9:
+        return "neutral"
+    if direction == "lower_is_better":
+        return "good" if delta < 0 else "bad"
+    return "good" if delta > 0 else "bad"
+
+
+def _round(v: float | None) -> float | None:
+    return None if v is None else round(v, 4)
+
+
+def term_stats(data: Series, overlay: list[dict], direction: str) -> list[dict]:
+    """
+    One dict per entry of `overlay` (sorted by date, as Indicator data is),
+    with the overlay entry under "gov" and the statistics listed above. Terms
+    for which no start or end value exists have delta and rag set to None.
+    """
+    ords: list[int] = []
+    vals: list[Value] = []
+    for o, v, is_int in zip(data.ordinals, data.floats, data.flags):
+        if v == v:                       # skip NaN (missing)
+            ords.append(o)
+            vals.append(int(v) if is_int else v)
+    n = len(vals)
+
+    bounds = [to_ordinal(str(gov["date"])) for gov in overlay]
+    result = []
+    lo = 0
+    for i, gov in enumerate(overlay):
+        lo = bisect_left(ords, bounds[i], lo)
+        if i + 1 < len(overlay):
+            hi = bisect_left(ords, bounds[i + 1], lo)
+            end = vals[hi - 1] if hi > 0 else None
+        else:
+            hi = n
+            end = vals[-1] if n else None
+        start = vals[lo] if lo < n else None
+
+        delta = rag = None
+        if start is not None and end is not None:
+            delta = end - start
+            rag = _rag(delta, direction)
+
+        inside = vals[lo:hi]
+        mean = lowest = highest = annualised = None
+        if inside:
+            mean = sum(inside) / len(inside)
+            lowest, highest = min(inside), max(inside)
+            days = ords[hi - 1] - ords[lo]
+            if days > 0:
+                annualised = (inside[-1] - inside[0]) / (days / DAYS_PER_YEAR)
+
+        result.append({
+            "gov":        gov,
+            "start":      start,
+            "end":        end,
+            "delta":      delta,
+            "rag":        rag,
+            "points":     len(inside),
+            "mean":       _round(mean),
+            "min":        lowest,
+            "max":        highest,
+            "annualised": _round(annualised),
+        })
+        lo = hi
+
+    return result
+
@@ -0,0 +1,35 @@
+"""
+build._chart_series() downsamples long series; a missing point must still
+break the line at every resolution, not only in the full one.
+"""
+
+from datetime import date, timedelta
+
+from build import _chart_series
+from series import Series
+
+
+def _series(n: int, missing: set[int]) -> Series:
+    start = date(2000, 1, 1)
+    return Series.from_dict({
+        (start + timedelta(days=30 * i)).isoformat(): None if i in missing else float(i % 17)
+        for i in range(n)
+    })
+
+
+def test_gaps_survive_downsampling():
+    missing = {5, 6, 40, 41, 42, 150, 299}
+    levels = _chart_series({"data": _series(300, missing)}, "1900-01-01", target=50, levels=2)
+    assert [len(level) for level in levels][-1] == 300
+    gap_starts = {5, 40, 150, 299}
+    start = date(2000, 1, 1)
+    for level in levels:
+        nulls = {p["x"] for p in level if p["y"] is None}
+        assert {(start + timedelta(days=30 * i)).isoformat() for i in gap_starts} <= nulls
+        assert [p["x"] for p in level] == sorted(p["x"] for p in level)
+
+
+def test_short_series_untouched():
+    data = _series(20, {3})
+    (level,) = _chart_series({"data": data}, "1900-01-01", target=50)
+    assert [(p["x"], p["y"]) for p in level] == list(data.items())
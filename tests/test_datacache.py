@@ -0,0 +1,58 @@
+"""
+datacache.load() must serve warm entries without holding a file descriptor
+per loaded indicator, or a build with more indicators than the descriptor
+limit falls back to parsing YAML (or fails outright in worker processes).
+"""
+
+import pytest
+
+import datacache
+from update import _parse
+
+resource = pytest.importorskip("resource")
+
+INDICATORS = 200
+FD_LIMIT   = 64
+
+
+def _yaml(i: int) -> str:
+    return (
+        f"id: test_{i}\n"
+        "graph:\n"
+        "- x: date\n"
+        "  y: Value\n"
+        "  data:\n"
+        f"    2020-01-01: {i}\n"
+        f"    2020-04-01: {i}.5\n"
+    )
+
+
+def test_warm_load_beyond_fd_limit(tmp_path, monkeypatch):
+    if not datacache.ENABLED:
+        pytest.skip("binary cache disabled on this platform")
+    monkeypatch.setattr(datacache, "CACHE_DIR", tmp_path / "cache")
+    paths = []
+    for i in range(INDICATORS):
+        path = tmp_path / f"test_{i}.yaml"
+        path.write_text(_yaml(i), encoding="utf-8")
+        paths.append(path)
+    for path in paths:
+        datacache.load(path, _parse)                  # cold: parse and write
+
+    parsed = []
+
+    def parse(text: str) -> dict:
+        parsed.append(text)
+        return _parse(text)
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(FD_LIMIT, hard), hard))
+    try:
+        docs = [datacache.load(path, parse) for path in paths]
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+    assert parsed == []
+    assert [doc["graph"][0]["data"].latest()[1] for doc in docs] == [
+        i + 0.5 for i in range(INDICATORS)
+    ]
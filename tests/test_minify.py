@@ -0,0 +1,26 @@
+"""
+minify.py removes only ASCII whitespace; non-breaking and other Unicode
+spaces are page content and must survive, however the input is chunked.
+"""
+
+from minify import minify
+
+PAGE = (
+    "<p>Cash\u00a0rate  \u00a0 target</p>\n\n"
+    "<script>\n  const s = 'a\u2028b\u00a0';\n\r\n  f();  \n</script>\n"
+    "<pre> keep\u00a0 this </pre>"
+)
+
+
+def test_unicode_spaces_survive():
+    out, _ = minify([PAGE])
+    assert out == (
+        "<p>Cash\u00a0rate \u00a0 target</p>\n"
+        "<script>const s = 'a\u2028b\u00a0';\nf();\n</script>\n"
+        "<pre> keep\u00a0 this </pre>"
+    )
+
+
+def test_chunking_does_not_matter():
+    whole, size = minify([PAGE])
+    assert minify(list(PAGE)) == (whole, size)
@@ -0,0 +1,100 @@
+"""
+update._save() streams charted Series into the file instead of dumping them
+through PyYAML; it must write exactly what the dumper writes for the dict form
+of the same document, and the file must load back to the same document.
+"""
+
+import math
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from series import Series
+from update import _dump, _parse, _save
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def _plain(doc: dict) -> dict:
+    """`doc` with every Series turned back into a dict."""
+    doc = dict(doc)
+    if isinstance(doc.get("graph"), list):
+        doc["graph"] = [
+            {**g, "data": g["data"].to_dict()} if isinstance(g.get("data"), Series) else g
+            for g in doc["graph"]
+        ]
+    return doc
+
+
+def _points(doc: dict) -> list[list[tuple[str, str]]]:
+    """Each charted graph's points, values as repr() so 4 != 4.0 and -0.0 != 0.0."""
+    return [[(d, repr(v)) for d, v in g["data"].items()]
+            for g in doc.get("graph", []) if isinstance(g.get("data"), Series)]
+
+
+def _round_trip(tmp_path: Path, doc: dict) -> str:
+    path = tmp_path / "indicator.yaml"
+    _save(path, doc)
+    text = path.read_text(encoding="utf-8")
+    assert text == _dump(_plain(doc))
+    reloaded = _parse(text)
+    assert reloaded == doc
+    assert _points(reloaded) == _points(doc)
+    return text
+
+
+def _indicator(*graphs: dict) -> dict:
+    return {
+        "id":           "test_indicator",
+        "title":        "Test Indicator",
+        "frequency":    "Quarterly",
+        "last_updated": date(2024, 1, 1),
+        "graph":        list(graphs),
+    }
+
+
+@pytest.mark.parametrize("path", sorted(DATA_DIR.glob("*.yaml")), ids=lambda p: p.stem)
+def test_data_files(tmp_path, path):
+    _round_trip(tmp_path, _parse(path.read_text(encoding="utf-8")))
+
+
+def test_empty_series(tmp_path):
+    text = _round_trip(tmp_path, _indicator({"x": "date", "y": "Value", "data": Series()}))
+    assert "  data: {}\n" in text
+
+
+def test_special_floats(tmp_path):
+    values = {
+        "2020-01-01": math.inf,
+        "2020-02-01": -math.inf,
+        "2020-03-01": 1e-05,
+        "2020-04-01": 1e20,
+        "2020-05-01": -0.0,
+        "2020-06-01": None,
+        "2020-07-01": 685000,
+        "2020-08-01": 4.0,
+    }
+    doc = _indicator({"x": "date", "y": "Value", "data": Series.from_dict(values)})
+    text = _round_trip(tmp_path, doc)
+    assert "2020-01-01: .inf\n" in text
+    assert "2020-02-01: -.inf\n" in text
+    assert "2020-04-01: 1.0e+20\n" in text
+    assert "2020-05-01: -0.0\n" in text
+    assert "2020-06-01: null\n" in text
+    assert "2020-07-01: 685000\n" in text
+
+
+def test_data_as_first_key(tmp_path):
+    data = Series.from_dict({"2020-01-01": 1.5, "2020-04-01": 2})
+    text = _round_trip(tmp_path, _indicator({"data": data, "x": "date", "y": "Value"}))
+    assert "- data:\n" in text
+
+
+def test_several_graphs_and_overlay(tmp_path):
+    doc = _indicator(
+        {"title": "Government", "data": {"2019-05-18": {"value": "A", "party": "B"}}},
+        {"x": "date", "y": "First", "data": Series.from_dict({"2020-01-01": 1})},
+        {"x": "date", "y": "Second", "data": Series.from_dict({"2021-01-01": 2.25})},
+    )
+    _round_trip(tmp_path, doc)
@@ -6,19 +6,33 @@ Usage:
     python update.py --dry-run       # preview changes, no writes
     python update.py --force         # update all regardless of staleness
     python update.py cpi             # target a specific indicator by id substring
+    python update.py --jobs 4        # run at most 4 collectors concurrently
+    python update.py --no-cache      # ignore and don't fill the response cache
+    python update.py --cache-only    # replay cached responses, no network
 """
 
 from __future__ import annotations
 
+import argparse
 import importlib.util
+import inspect
+import math
 import re
-import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import Any, Callable
 
 import yaml
 
+import atomicfile
+import catalog
+import datacache
+from collectors import bls, client
+from series import Series
+
 STALE_DAYS: dict[str, int] = {
     "Month":   42,
     "Quarter": 120,
@@ -26,33 +40,58 @@ STALE_DAYS: dict[str, int] = {
     "3 Year":  1280,
 }
 
+# How long a fetched response may be replayed from .cache/responses. Sources
+# publish at most once per period, so slower series can be cached for longer.
+CACHE_TTL_HOURS: dict[str, int] = {
+    "Month":   6,
+    "Quarter": 24,
+    "Annual":  72,
+    "3 Year":  168,
+}
+
+# Collectors spend nearly all their time waiting on the network, so a small
+# thread pool is enough to overlap them without hammering any one source.
+DEFAULT_JOBS = 8
+
+# The graph list (and its data) starts at a top-level `graph:` line; any other
+# line starting in the first column after it is another top-level field.
+_GRAPH_LINE = b"graph:"
+_TOP_LEVEL  = re.compile(rb"^[^\s#-]", re.M)
+
 
 # ── YAML I/O ─────────────────────────────────────────────────────────────────
 
-def _normalise_date_keys(obj: Any) -> Any:
-    """Recursively convert datetime.date keys (produced by PyYAML) to ISO strings."""
-    if isinstance(obj, dict):
-        return {
-            (k.isoformat() if isinstance(k, date) else k): _normalise_date_keys(v)
-            for k, v in obj.items()
-        }
-    if isinstance(obj, list):
-        return [_normalise_date_keys(i) for i in obj]
-    return obj
-
-
-def _to_date_keys(obj: Any) -> Any:
-    """Recursively convert ISO date string keys back to datetime.date for clean YAML output."""
-    if isinstance(obj, dict):
-        result: dict = {}
-        for k, v in obj.items():
-            if isinstance(k, str) and re.match(r"^\d{4}-\d{2}-\d{2}$", k):
-                k = date.fromisoformat(k)
-            result[k] = _to_date_keys(v)
-        return result
-    if isinstance(obj, list):
-        return [_to_date_keys(i) for i in obj]
-    return obj
+# libyaml's parser and emitter when PyYAML was built with them; the pure-Python
+# classes otherwise. Either way construction and representation are Python.
+_BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_BaseDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_STR_TAG       = "tag:yaml.org,2002:str"
+_TIMESTAMP_TAG = "tag:yaml.org,2002:timestamp"
+_ISO_DATE      = re.compile(r"\d{4}-\d{2}-\d{2}\Z")
+
+
+class _Loader(_BaseLoader):
+    """Safe loader whose date (and datetime) mapping keys come out as ISO strings."""
+
+    def construct_mapping(self, node, deep=False):
+        for key_node, _ in node.value:
+            if key_node.tag == _TIMESTAMP_TAG:
+                if len(key_node.value) != 10:   # not a plain YYYY-MM-DD
+                    key_node.value = self.construct_yaml_timestamp(key_node).isoformat()
+                key_node.tag = _STR_TAG
+        return super().construct_mapping(node, deep=deep)
+
+
+class _Dumper(_BaseDumper):
+    """Safe dumper that writes ISO date string mapping keys as unquoted dates."""
+
+    def represent_mapping(self, tag, mapping, flow_style=None):
+        node = super().represent_mapping(tag, mapping, flow_style)
+        for key_node, _ in node.value:
+            if key_node.tag == _STR_TAG and _ISO_DATE.match(key_node.value):
+                key_node.tag = _TIMESTAMP_TAG
+        return node
 
 
 def _coerce(val: Any) -> Any:
@@ -65,48 +104,250 @@ def _coerce(val: Any) -> Any:
         return val
 
 
+def _parse(text: str) -> dict:
+    """Parse an indicator document; charted graph data becomes a Series."""
+    data = yaml.load(text, Loader=_Loader)
+    graphs = data.get("graph")
+    for g in graphs if isinstance(graphs, list) else []:
+        if "x" in g and "data" in g:
+            g["data"] = Series.from_dict(g["data"])
+    return data
+
+
 def _load(path: Path) -> dict:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
-    return _normalise_date_keys(raw)
+    return datacache.load(path, _parse)
 
 
-def _save(path: Path, data: dict) -> None:
-    path.write_text(
-        yaml.dump(
-            _to_date_keys(data),
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-            width=120,
-        ),
-        encoding="utf-8",
+def _load_header(path: Path) -> dict | None:
+    """
+    The top-level fields before `graph:`, parsed without reading any graph
+    data, or None if more top-level fields follow the graph list (then only
+    the whole document has them all).
+    """
+    lines = []
+    with path.open("rb") as f:
+        for line in f:
+            if line.startswith(_GRAPH_LINE):
+                if _TOP_LEVEL.search(f.read()):
+                    return None
+                break
+            lines.append(line)
+    header = yaml.load(b"".join(lines), Loader=_Loader)
+    return header if isinstance(header, dict) else None
+
+
+def _dump(data: dict) -> str:
+    return yaml.dump(
+        data,
+        Dumper=_Dumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        width=120,
     )
 
 
+# A charted graph's Series is dumped as this placeholder, then swapped for its lines.
+_SERIES_STUB = "__series_{}__"
+_STUB_LINE   = re.compile(r"^( *(?:- )*)data: __series_(\d+)__\n", re.M)
+
+
+def _scalar(v: int | float | None) -> str:
+    """A Series value written the way SafeRepresenter writes it."""
+    if v is None:
+        return "null"
+    if isinstance(v, int):
+        return str(v)
+    if v in (math.inf, -math.inf):
+        return ".inf" if v > 0 else "-.inf"
+    text = repr(v).lower()
+    if "." not in text and "e" in text:
+        text = text.replace("e", ".0e", 1)
+    return text
+
+
+def _save(path: Path, data: dict) -> None:
+    """
+    Write an indicator document; charted graph data may be a Series. PyYAML
+    dumps everything else, and each Series is streamed into the file in place
+    of its placeholder as `date: value` lines: the same bytes the generic
+    dumper writes for the dict form, without building its node tree.
+    """
+    series: list[Series] = []
+
+    def stub(g: Any) -> Any:
+        if not isinstance(g, dict) or not isinstance(g.get("data"), Series):
+            return g
+        if not g["data"]:
+            return {**g, "data": {}}
+        series.append(g["data"])
+        return {**g, "data": _SERIES_STUB.format(len(series) - 1)}
+
+    doc = dict(data)
+    if isinstance(doc.get("graph"), list):
+        doc["graph"] = [stub(g) for g in doc["graph"]]
+    text = _dump(doc)
+
+    with atomicfile.replacing(path) as f:
+        pos = 0
+        for m in _STUB_LINE.finditer(text):
+            f.write(text[pos:m.start()])
+            f.write(f"{m.group(1)}data:\n")
+            pad = " " * (len(m.group(1)) + 2)
+            f.writelines(f"{pad}{d}: {_scalar(v)}\n" for d, v in series[int(m.group(2))].items())
+            pos = m.end()
+        f.write(text[pos:])
+
+
+# ── in-place append ──────────────────────────────────────────────────────────
+#
+# A collector run usually adds a point or two, so rather than re-serialising
+# the whole document, save() splices the new `date: value` lines into the
+# graph data blocks of the file as it is and rewrites only `last_updated`.
+# Everything else keeps its bytes (and hand formatting such as `4.00`), so the
+# diff shows just the new points. Any layout other than the plain block style
+# written by _save() and used by hand-maintained files gets a full rewrite.
+
+_LAST_UPDATED_LINE = re.compile(r"last_updated: *[0-9-]*\n")
+_ITEM_LINE         = re.compile(r"( *)- ")
+_DATA_LINE         = re.compile(r"( +)(\d{4}-\d{2}-\d{2}):(?: .*)?\n")
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+def _patch_block(lines: list[str], key_indent: int, series: Series,
+                 points: list[tuple[str, Any]]) -> list[str] | None:
+    """
+    The lines of one item of the graph list with `points` inserted into its
+    `data:` block, or None if the block is not a plain run of date lines
+    holding exactly the other points of `series`.
+    """
+    start = next((i + 1 for i, line in enumerate(lines)
+                  if line[key_indent:] == "data:\n" and line[:key_indent].strip() in ("", "-")), None)
+    if start is None:
+        return None
+    end = start
+    while end < len(lines) and lines[end].strip() and _indent(lines[end]) > key_indent:
+        end += 1
+    block = [_DATA_LINE.fullmatch(line) for line in lines[start:end]]
+    if not block or not all(block) or len({m.group(1) for m in block}) != 1:
+        return None
+    dates = [m.group(2) for m in block]
+    if len(dates) + len(points) != len(series) or dates != sorted(set(dates)):
+        return None
+
+    pad = block[0].group(1)
+    merged, i = [], start
+    for d, v in sorted(points):
+        while i < end and lines[i].lstrip(" ")[:10] < d:
+            merged.append(lines[i])
+            i += 1
+        if i < end and lines[i].lstrip(" ")[:10] == d:
+            return None
+        merged.append(f"{pad}{d}: {_scalar(v)}\n")
+    return lines[:start] + merged + lines[i:]
+
+
+def _patch(text: str, graphs: list[dict], added: dict[int, list[tuple[str, Any]]],
+           last_updated: date | None) -> str | None:
+    """
+    `text` with the `added` points (graph index -> [(date, value)]) spliced
+    into their graphs' data blocks and last_updated set, or None if the file
+    is not laid out as expected.
+    """
+    lines = text.splitlines(keepends=True)
+    if not lines or not lines[-1].endswith("\n") or last_updated is None:
+        return None
+    try:
+        top = lines.index("graph:\n")
+    except ValueError:
+        return None
+
+    updated = [i for i in range(top) if lines[i].startswith("last_updated:")]
+    if len(updated) != 1 or not _LAST_UPDATED_LINE.fullmatch(lines[updated[0]]):
+        return None
+    lines[updated[0]] = f"last_updated: {last_updated.isoformat()}\n"
+
+    # Split the graph list into its items
+    first = next((i for i in range(top + 1, len(lines)) if lines[i].strip()), None)
+    m = _ITEM_LINE.match(lines[first]) if first is not None else None
+    if m is None:
+        return None
+    item_indent = len(m.group(1))
+    starts, end = [], first
+    while end < len(lines) and (not lines[end].strip()
+                                or (_indent(lines[end]) >= item_indent and lines[end][0] in " -")):
+        if _indent(lines[end]) == item_indent and lines[end].lstrip(" ").startswith("- "):
+            starts.append(end)
+        end += 1
+    if len(starts) != len(graphs):
+        return None
+    bounds = list(zip(starts, starts[1:] + [end]))
+
+    out = lines[:first]
+    for index, (lo, hi) in enumerate(bounds):
+        item = lines[lo:hi]
+        if index in added:
+            item = _patch_block(item, item_indent + 2, graphs[index]["data"], added[index])
+            if item is None:
+                return None
+        out += item
+    return "".join(out + lines[end:])
+
+
 # ── Indicator ─────────────────────────────────────────────────────────────────
 
 class Indicator:
+    """
+    One indicator file. Only the header (the fields before `graph:`) is parsed
+    up front, which is all identity, schedule and staleness need; the whole
+    document, graph data included, is loaded on first access to it. The file's
+    catalog entry (catalog.py), when given, stands in for the header, so that
+    nothing is parsed until the data is needed.
+    """
+
     STATUS_CURRENT         = "current"
     STATUS_STALE_COLLECTOR = "stale:collector"
     STATUS_STALE_MANUAL    = "stale:manual"
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, catalog_entry: dict | None = None) -> None:
         self.path = path
-        self._data = _load(path)
+        self.catalog_entry = catalog_entry
+        self._header = catalog_entry if catalog_entry is not None else _load_header(path)
+        self._doc: dict | None = None
+        self._module: ModuleType | None = None
+        # graph index -> points merge() added since the file was last written
+        self._added: dict[int, list[tuple[str, Any]]] = defaultdict(list)
+
+    @property
+    def _data(self) -> dict:
+        """The whole document, loaded on first access."""
+        if self._doc is None:
+            self._doc = _load(self.path)
+        return self._doc
+
+    @property
+    def _meta(self) -> dict:
+        """Top-level fields: the header until the whole document is loaded."""
+        if self._doc is None and self._header is not None:
+            return self._header
+        return self._data
 
     # ── identity ─────────────────────────────────────────────────────────────
 
     @property
     def id(self) -> str:
-        return self._data["id"]
+        return self._meta["id"]
 
     @property
     def jurisdiction(self) -> str:
-        return self._data["jurisdiction"]
+        return self._meta["jurisdiction"]
 
     @property
     def title(self) -> str:
-        return self._data["title"]
+        return self._meta["title"]
 
     @property
     def label(self) -> str:
@@ -116,15 +357,15 @@ class Indicator:
 
     @property
     def category(self) -> str:
-        return self._data.get("category", "")
+        return self._meta.get("category", "")
 
     @property
     def frequency(self) -> str:
-        return self._data["frequency"]
+        return self._meta["frequency"]
 
     @property
     def last_updated(self) -> date | None:
-        v = self._data.get("last_updated")
+        v = self._meta.get("last_updated")
         if not v:
             return None
         return v if isinstance(v, date) else date.fromisoformat(str(v))
@@ -149,7 +390,10 @@ class Indicator:
 
     @property
     def chart_graphs(self) -> list[dict]:
-        """Graph entries that are rendered as charts (have x/y axis fields)."""
+        """
+        Graph entries that are rendered as charts (have x/y axis fields).
+        Their `data` is a Series (ISO date -> value, sorted by date).
+        """
         return [g for g in self.graphs if "x" in g]
 
     @property
@@ -161,7 +405,7 @@ class Indicator:
 
     @property
     def collector(self) -> str | None:
-        return self._data.get("collector")
+        return self._meta.get("collector")
 
     @property
     def status(self) -> str:
@@ -169,13 +413,32 @@ class Indicator:
             return self.STATUS_CURRENT
         return self.STATUS_STALE_COLLECTOR if self.collector else self.STATUS_STALE_MANUAL
 
-    def collect(self) -> list[tuple]:
+    def collector_module(self) -> ModuleType:
+        """The loaded collector script (loaded once per Indicator)."""
         if not self.collector:
             raise RuntimeError(f"{self.id}: no collector configured")
-        spec = importlib.util.spec_from_file_location("_col", self.collector)
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
-        return mod.collect()
+        if self._module is None:
+            spec = importlib.util.spec_from_file_location("_col", self.collector)
+            mod = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(mod)
+            self._module = mod
+        return self._module
+
+    def collect(self) -> list[tuple]:
+        """
+        Run the collector. Collectors may optionally accept `since` (this
+        indicator's last_updated) and/or `known` (dates already present) to
+        request only new data; plain `collect()` collectors keep working.
+        """
+        fn = self.collector_module().collect
+        params = inspect.signature(fn).parameters
+        takes_any = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values())
+        kwargs: dict[str, Any] = {}
+        if takes_any or "since" in params:
+            kwargs["since"] = self.last_updated
+        if takes_any or "known" in params:
+            kwargs["known"] = self.known_dates()
+        return fn(**kwargs)
 
     # ── data access ───────────────────────────────────────────────────────────
 
@@ -205,29 +468,69 @@ class Indicator:
         if not new_rows:
             return 0
 
+        positions = [i for i, g in enumerate(self.graphs) if "x" in g]
         for row in new_rows:
             d = row[0]
             for col_offset, graph in enumerate(cg):
                 col_index = col_offset + 1
                 if col_index < len(row):
-                    graph.setdefault("data", {})[d] = _coerce(row[col_index])
+                    data = graph.setdefault("data", Series())
+                    data.set(d, _coerce(row[col_index]))
+                    self._added[positions[col_offset]].append((d, data[d]))
 
         self._data["last_updated"] = date.fromisoformat(new_rows[-1][0])
         return len(new_rows)
 
     def save(self) -> None:
-        _save(self.path, self._data)
+        """
+        Write the indicator to its file, atomically. Points added by merge()
+        are spliced into the existing file when its layout allows (see
+        _patch); otherwise, or if nothing was merged, the whole document is
+        written out.
+        """
+        patched = None
+        if self._added:
+            try:
+                text = self.path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                text = ""
+            patched = _patch(text, self.graphs, self._added, self.last_updated)
+        if patched is None:
+            _save(self.path, self._data)
+        else:
+            with atomicfile.replacing(self.path) as f:
+                f.write(patched)
+        self._added.clear()
+        self.catalog_entry = catalog.update(self)
+
+
+def load_all(data_dir: Path = Path("data"), target: str | None = None) -> list[Indicator]:
+    """
+    Every indicator under `data_dir` (only those whose file name contains
+    `target`, if given), in file order, with its refreshed catalog entry as
+    header.
+    """
+    # File names are indicator ids, so excluded files are never read.
+    paths = [path for path in sorted(data_dir.glob("*.yaml"))
+             if not target or target in path.stem]
+    entries = catalog.refresh(paths, Indicator)
+    return [Indicator(path, entries[path.name]) for path in paths]
 
 
 # ── runner ────────────────────────────────────────────────────────────────────
 
-def _run_indicator(ind: Indicator, dry_run: bool) -> tuple[str, str]:
+def _run_indicator(
+    ind: Indicator, collect: Callable[[], list[tuple]], dry_run: bool
+) -> tuple[str, str]:
     """
-    Attempt to collect and merge data for a stale indicator.
+    Merge the result of `collect` (the indicator's collector output, or the
+    exception it raised) into a stale indicator.
     Returns (outcome, message) where outcome is 'updated', 'current', or 'error'.
     """
     try:
-        rows = ind.collect()
+        rows = collect()
+    except client.NotModified:
+        return "current", "not modified since last fetch"
     except Exception as exc:
         return "error", f"collector failed: {exc}"
 
@@ -250,19 +553,80 @@ def _run_indicator(ind: Indicator, dry_run: bool) -> tuple[str, str]:
     return "updated", f"added {added} row(s) through {latest}"
 
 
+def _collect(ind: Indicator) -> list[tuple]:
+    """Run the indicator's collector, recording HTTP validators under its id."""
+    ttl = CACHE_TTL_HOURS.get(ind.frequency, 6) * 3600
+    with client.tracking(ind.id, ttl=ttl):
+        return ind.collect()
+
+
+def _prefetch_bls(inds: list[Indicator]) -> None:
+    """
+    Request every BLS series the pending collectors declare (BLS_SERIES) in one
+    batched call. On failure collectors fall back to one request per series.
+    """
+    requests: list[tuple[str, int | None]] = []
+    ttls: list[int] = []
+    for ind in inds:
+        try:
+            declared = getattr(ind.collector_module(), "BLS_SERIES", ())
+        except Exception:
+            continue  # reported when the collector itself runs
+        # One year before last_updated covers collectors that also need the
+        # year-ago value (e.g. us_cpi's year-over-year change).
+        since = ind.last_updated
+        startyear = since.year - 1 if since else None
+        requests.extend((sid, startyear) for sid in declared)
+        if declared:
+            ttls.append(CACHE_TTL_HOURS.get(ind.frequency, 6) * 3600)
+    if not requests:
+        return
+    try:
+        with client.tracking("bls", ttl=min(ttls)):
+            bls.prefetch(requests)
+    except Exception as exc:
+        print(f"  BLS batch request failed ({exc}); fetching series individually")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Refresh stale indicators under data/.")
+    parser.add_argument("target", nargs="?",
+                        help="only update indicators whose id contains this substring")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="preview changes, no writes")
+    parser.add_argument("--force", action="store_true",
+                        help="update all regardless of staleness")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, metavar="N",
+                        help=f"number of collectors to run concurrently (default {DEFAULT_JOBS})")
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument("--no-cache", dest="cache", action="store_const",
+                       const=client.CACHE_OFF, default=client.CACHE_ON,
+                       help="always fetch from the network and don't store responses")
+    cache.add_argument("--cache-only", dest="cache", action="store_const",
+                       const=client.CACHE_ONLY,
+                       help="replay cached responses of any age; never touch the network")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
+
 def main() -> None:
-    dry_run = "--dry-run" in sys.argv
-    force   = "--force"   in sys.argv
-    target  = next((a for a in sys.argv[1:] if not a.startswith("--")), None)
+    args    = _parse_args()
+    dry_run = args.dry_run
+    force   = args.force
+    target  = args.target
+    client.set_cache_mode(args.cache)
 
     updated: list[str] = []
     manual:  list[str] = []
     errors:  list[str] = []
     current: list[str] = []
 
-    for yaml_path in sorted(Path("data").glob("*.yaml")):
-        ind = Indicator(yaml_path)
+    # ── staleness ─────────────────────────────────────────────────────────────
+    pending: list[tuple[Indicator, str]] = []
 
+    for ind in load_all(target=target):
         if target and target not in ind.id:
             continue
 
@@ -278,16 +642,36 @@ def main() -> None:
             manual.append(f"{ind.label}  (last: {ind.last_updated or 'never'})")
             continue
 
-        print(f"  {ind.label} ...", end=" ", flush=True)
-        outcome, message = _run_indicator(ind, dry_run)
-        print(message)
+        pending.append((ind, age))
 
-        if outcome == "updated":
-            updated.append(f"{ind.label} -> {message}")
-        elif outcome == "current":
-            current.append(f"{ind.label}  ({age})")
-        else:
-            errors.append(f"{ind.label}: {message}")
+    # ── collection ────────────────────────────────────────────────────────────
+    # Collectors run concurrently; results are merged and saved one at a time
+    # in file order so output and writes are the same as a serial run.
+    _prefetch_bls([ind for ind, _ in pending])
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(_collect, ind) for ind, _ in pending]
+
+        for (ind, age), future in zip(pending, futures):
+            print(f"  {ind.label} ...", end=" ", flush=True)
+            outcome, message = _run_indicator(ind, future.result, dry_run)
+            print(message)
+
+            # Only remember validators once the fetched data is reflected on
+            # disk; otherwise the next run would get a 304 and miss it.
+            if outcome == "current" or (outcome == "updated" and not dry_run):
+                client.commit(ind.id)
+            else:
+                client.discard(ind.id)
+
+            if outcome == "updated":
+                updated.append(f"{ind.label} -> {message}")
+            elif outcome == "current":
+                current.append(f"{ind.label}  ({age})")
+            else:
+                errors.append(f"{ind.label}: {message}")
+
+    client.close_all()
 
     # ── summary ───────────────────────────────────────────────────────────────
     print()